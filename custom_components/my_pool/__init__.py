@@ -76,6 +76,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     for platform in platforms:
         await hass.config_entries.async_forward_entry_unload(entry, platform)
 
+    await coordinator.terminate()
+
     del hass.data[DOMAIN][entry.entry_id]
 
     return True
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Remove stored configuration of a deleted config entry."""
+    _LOGGER.info(f"Removing {DOMAIN} integration, Entry ID: {entry.entry_id}")
+
+    config_manager = ConfigManager(hass, entry)
+
+    await config_manager.remove()
@@ -63,6 +63,8 @@ class BaseEntity(CoordinatorEntity):
     _device_id: int
     _entity_description: IntegrationEntityDescription
     _translations: dict
+    _generation: int | None
+    _is_available: bool | None
 
     def __init__(
         self,
@@ -75,17 +77,17 @@ class BaseEntity(CoordinatorEntity):
         self._entity_description = entity_description
         self.entity_description = entity_description
 
-        device_info = coordinator.get_device(device_id)
-        identifiers = device_info.get("identifiers")
-        serial_number = list(identifiers)[0][1]
+        device_identity = coordinator.get_device_identity(device_id)
+        device_info = device_identity.get("device_info")
+        unique_id_prefix = device_identity.get("unique_id_prefixes").get(
+            entity_description.platform
+        )
 
         entity_name = coordinator.config_manager.get_entity_name(
             entity_description, device_info
         )
 
-        unique_id = slugify(
-            f"{entity_description.platform}_{serial_number}_{entity_description.key}"
-        )
+        unique_id = slugify(f"{unique_id_prefix}{entity_description.key}")
 
         self._attr_device_info = device_info
         self._attr_name = entity_name
@@ -93,6 +95,23 @@ class BaseEntity(CoordinatorEntity):
 
         self._data = {}
         self._device_id = device_id
+        self._generation = None
+        self._is_available = None
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+
+        self.async_on_remove(
+            self._local_coordinator.async_add_device_listener(
+                self._device_id,
+                self._handle_coordinator_update,
+                self._local_coordinator.get_source_keys(self._entity_description),
+            )
+        )
+
+        # Updates are sent only once the source keys changed, set initial state
+        self._handle_coordinator_update()
 
     @property
     def _local_coordinator(self) -> Coordinator:
@@ -107,9 +126,7 @@ class BaseEntity(CoordinatorEntity):
             self._entity_description, self._device_id, key
         )
 
-        await async_device_action(key, self.entity_description, *kwargs)
-
-        await self.coordinator.async_request_refresh()
+        await async_device_action(self._device_id, self.entity_description, *kwargs)
 
     def update_component(self, data):
         pass
@@ -117,17 +134,34 @@ class BaseEntity(CoordinatorEntity):
     def _handle_coordinator_update(self) -> None:
         """Fetch new state parameters for the sensor."""
         try:
+            generation = self._local_coordinator.get_device_generation(self._device_id)
+            is_available = self.available
+            is_availability_changed = is_available != self._is_available
+
+            if (
+                generation is not None
+                and generation == self._generation
+                and not is_availability_changed
+            ):
+                return
+
+            self._generation = generation
+            self._is_available = is_available
+
             new_data = self._local_coordinator.get_data(
                 self._device_id, self.entity_description
             )
 
-            if self._data != new_data:
+            is_data_changed = self._data != new_data
+
+            if is_data_changed:
                 _LOGGER.debug(f"Data for {self.unique_id}: {new_data}")
 
                 self.update_component(new_data)
 
                 self._data = new_data
 
+            if is_data_changed or is_availability_changed:
                 self.async_write_ha_state()
 
         except Exception as ex:
@@ -1,13 +1,33 @@
 from datetime import timedelta
 
+from .endpoints import Endpoints
+
 DOMAIN = "my_pool"
 DEFAULT_NAME = "MyPool"
 MANUFACTURER = "Magen Ecoenergy"
 
 UPDATE_API = timedelta(minutes=5)
+UPDATE_API_ACTIVE = timedelta(minutes=1)
+UPDATE_API_OFFLINE_MAX = timedelta(hours=1)
+UPDATE_API_MIN_INTERVAL = timedelta(seconds=30)
+UPDATE_API_JITTER = 0.05
+API_REQUESTS_BUDGET_PER_HOUR = 240
+DEVICE_REFRESH_COOLDOWN = timedelta(seconds=3)
+PENDING_WRITE_TIMEOUT = timedelta(minutes=2)
+TELEMETRY_BATCH_WINDOW = timedelta(milliseconds=500)
+METRICS_SAMPLES = 50
+UPDATE_INVENTORY = timedelta(minutes=30)
+UPDATE_API_DEADLINE = timedelta(seconds=90)
+
+COMMAND_PRIORITY_HIGH = 0
+COMMAND_PRIORITY_LOW = 1
 
 SIGNAL_DEVICE_NEW = f"signal_{DOMAIN}_device_new"
+DATA_ACCOUNT_REGISTRY = f"{DOMAIN}_account_registry"
 CONFIGURATION_FILE = f"{DOMAIN}.config.json"
+ENTRY_CONFIGURATION_FILE = f"{DOMAIN}.{{}}.config.json"
+DATA_SHARED_STORAGE = f"{DOMAIN}_shared_storage"
+DATA_TRANSLATION_CACHE = f"{DOMAIN}_translation_cache"
 
 PRODUCT_URL = "https://www.magen-ecoenergy.com/"
 
@@ -15,12 +35,68 @@ CONF_FCM_TOKEN = "fcmToken"
 
 STORAGE_DATA_KEY = "key"
 STORAGE_DATA_TOKEN_KEY = "token"
+STORAGE_SAVE_DELAY = timedelta(seconds=30)
+
+TOKEN_VALIDATION_TTL = timedelta(minutes=30)
+TOKEN_EXPIRY_MARGIN = timedelta(minutes=5)
+TOKEN_REFRESH_MARGIN = timedelta(minutes=10)
+TOKEN_REFRESH_INTERVAL = timedelta(hours=12)
+TOKEN_REFRESH_MIN_DELAY = timedelta(minutes=1)
+TOKEN_REFRESH_RETRY_DELAY = timedelta(minutes=2)
 
 API_MAX_ATTEMPTS = 3
+API_RETRY_BASE_DELAY = 1
+API_RETRY_MAX_DELAY = 30
+API_RETRY_BUDGET = 10
+API_RETRYABLE_STATUSES = [408, 425, 429, 500, 502, 503, 504]
+
+API_CONNECTION_LIMIT = 10
+API_KEEPALIVE_TIMEOUT = 60
+API_DNS_CACHE_TTL = 300
+
+API_CONNECT_TIMEOUT = 10
+API_READ_TIMEOUT = 30
+API_ENDPOINT_TIMEOUTS = {
+    Endpoints.CheckToken: (5, 15),
+    Endpoints.DeviceStatus: (5, 15),
+}
+
+# Duplicate slow idempotent requests (above the percentile of recent latencies)
+API_HEDGED_ENDPOINTS = [Endpoints.DeviceStatus]
+API_HEDGE_PERCENTILE = 0.95
+API_HEDGE_MIN_SAMPLES = 20
+API_HEDGE_MAX_RATIO = 0.1
+API_LATENCY_SAMPLES = 200
+
+RATE_LIMIT_READ = "read"
+RATE_LIMIT_WRITE = "write"
+RATE_LIMIT_DEFAULT_PAUSE = timedelta(seconds=60)
+# Requests per second, burst
+API_RATE_LIMITS = {
+    RATE_LIMIT_READ: (1, 10),
+    RATE_LIMIT_WRITE: (0.5, 5),
+}
+
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+CIRCUIT_BREAKER_RECOVERY_TIMEOUT = timedelta(minutes=2)
+CIRCUIT_BREAKER_STATE_CLOSED = "closed"
+CIRCUIT_BREAKER_STATE_OPEN = "open"
+CIRCUIT_BREAKER_STATE_HALF_OPEN = "half_open"
+CIRCUIT_BREAKER_STATES = [
+    CIRCUIT_BREAKER_STATE_CLOSED,
+    CIRCUIT_BREAKER_STATE_OPEN,
+    CIRCUIT_BREAKER_STATE_HALF_OPEN,
+]
+API_MAX_CONCURRENT_REQUESTS = 5
 
 DATA_ITEM_DEVICES = "device"
 DATA_ITEM_MEMBER_DETAILS = "member-details"
 DATA_ITEM_CONFIG = "configuration"
+DATA_ITEM_API_METRICS = "api-metrics"
+DATA_ITEM_WRITE_METRICS = "write-metrics"
+DATA_ITEM_COMMAND_METRICS = "command-metrics"
+DATA_ITEM_RATE_LIMIT_METRICS = "rate-limit-metrics"
+DATA_ITEM_HEDGING_METRICS = "hedging-metrics"
 
 PRODUCT_PAGE = {"G+": "resilience_g"}
 
@@ -59,14 +135,26 @@ CONFIG_AUTOMATION_CHANNEL_MODE = "config-automation-channel*-mode"
 CONFIG_AUTOMATION_CHANNEL_STATE = "config-automation-channel*-state"
 RUNTIME_AUTOMATION_STATE_CHANNEL_STATE = "runtime-automationState-channel*-state"
 RUNTIME_AUTOMATION_STATE_CHANNEL_TIMELEFT = "runtime-automationState-channel*-timeLeft"
+AUTOMATION_CHANNELS = 7
 SALINITY_STATUS = "salinity-status"
 SALT_MISSING = "salt-missing"
 RUNTIME_POWER = "runtime-power"
 RUNTIME_COVER_STATE = "runtime-coverState"
 RUNTIME_AUTOMATION_PRESENT = "runtime-automationPresent"
+API_STATUS = "api-status"
 
 UNIT_PH = "ph"
 
+TEMPERATURE_SCALE = 100
+PH_MAXIMUM_VALUE = 14
+PH_SCALE = 10
+
+# Entities calculated from other keys of the device data
+DERIVED_KEY_DEPENDENCIES = {
+    SALT_MISSING: [CONFIG_TECHNICIAN_POOL_SIZE, RUNTIME_SALINITY_VALUE],
+    SALINITY_STATUS: [RUNTIME_SALINITY_VALUE],
+}
+
 UPDATE_TELEMETRY_PARAMS = [
     CONFIG_USER_POWER,
     CONFIG_USER_COVER_POWER,
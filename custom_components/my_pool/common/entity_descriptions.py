@@ -4,6 +4,9 @@ from typing import Callable
 from slugify import slugify
 
 from custom_components.my_pool.common.consts import (
+    API_STATUS,
+    AUTOMATION_CHANNELS,
+    CIRCUIT_BREAKER_STATES,
     CONFIG_AUTOMATION_CHANNEL_MODE,
     CONFIG_AUTOMATION_CHANNEL_STATE,
     CONFIG_TECHNICIAN_ACID_PUMP_ENABLE,
@@ -326,10 +329,19 @@ DEFAULT_ENTITY_DESCRIPTIONS: list[IntegrationEntityDescription] = [
         native_unit_of_measurement=UnitOfMass.KILOGRAMS,
         state_class=SensorStateClass.MEASUREMENT,
     ),
+    IntegrationSensorEntityDescription(
+        key=API_STATUS,
+        name="API Status",
+        translation_key=slugify(API_STATUS),
+        device_class=SensorDeviceClass.ENUM,
+        options=CIRCUIT_BREAKER_STATES,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:api",
+    ),
     AUTOMATION_ENTITY_DESCRIPTION,
 ]
 
-for i in range(1, 8):
+for i in range(1, AUTOMATION_CHANNELS + 1):
     index = str(i)
     automation_components = [
         IntegrationSelectEntityDescription(
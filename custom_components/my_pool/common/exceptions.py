@@ -34,3 +34,15 @@ class InvalidTokenError(Exception):
         result = f"Invalid token, Flow: {self.flow}"
 
         return result
+
+
+class CircuitOpenError(Exception):
+    name: str
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __str__(self):
+        result = f"API is unavailable, requests are blocked, Name: {self.name}"
+
+        return result
@@ -0,0 +1,87 @@
+from typing import Any, Callable
+
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.const import Platform
+
+from .consts import PH_MAXIMUM_VALUE, PH_SCALE, TEMPERATURE_SCALE, UNIT_PH
+from .entity_descriptions import IntegrationEntityDescription
+
+
+def decode_temperature(state: Any) -> float | None:
+    """Temperature is reported in hundredths of a degree."""
+    result = None if state is None else int(state) / TEMPERATURE_SCALE
+
+    return result
+
+
+def decode_ph(state: Any) -> float | None:
+    """PH is reported without decimal point (e.g. 72 or 720 for 7.2)."""
+    result = None
+
+    if state is not None:
+        result = float(state)
+
+        while result > PH_MAXIMUM_VALUE:
+            result /= 10
+
+    return result
+
+
+def encode_ph(value: Any) -> int | None:
+    """PH is written without decimal point (e.g. 72 for 7.2)."""
+    result = None if value is None else round(float(value) * PH_SCALE)
+
+    return result
+
+
+def decode_signal_strength(state: Any) -> float | None:
+    """Signal (RCPI) is reported in half dB steps, starting from -110dBm."""
+    result = None if state is None else (int(state) / 2) - 110
+
+    return result
+
+
+def get_value_decoder(
+    entity_description: IntegrationEntityDescription,
+) -> Callable[[Any], Any] | None:
+    """Decoder of the raw value reported by the device, None when not encoded."""
+    decoder = None
+    platform = entity_description.platform
+    unit_of_measurement = getattr(
+        entity_description, "native_unit_of_measurement", None
+    )
+
+    if (
+        platform in [Platform.SENSOR, Platform.NUMBER]
+        and unit_of_measurement == UNIT_PH
+    ):
+        decoder = decode_ph
+
+    elif platform == Platform.SENSOR:
+        device_class = entity_description.device_class
+
+        if device_class == SensorDeviceClass.TEMPERATURE:
+            decoder = decode_temperature
+
+        elif device_class == SensorDeviceClass.SIGNAL_STRENGTH:
+            decoder = decode_signal_strength
+
+    return decoder
+
+
+def get_value_encoder(
+    entity_description: IntegrationEntityDescription,
+) -> Callable[[Any], Any] | None:
+    """Encoder of the value written to the device, None when not encoded."""
+    encoder = None
+    unit_of_measurement = getattr(
+        entity_description, "native_unit_of_measurement", None
+    )
+
+    if (
+        entity_description.platform == Platform.NUMBER
+        and unit_of_measurement == UNIT_PH
+    ):
+        encoder = encode_ph
+
+    return encoder
@@ -41,7 +41,12 @@ class DomainFlowHandler(config_entries.ConfigFlow):
 
                 api = RestAPI(self.hass, config_manager)
 
-                await api.initialize(True)
+                try:
+                    await api.initialize(True)
+
+                finally:
+                    # Client is used only to validate the credentials
+                    await api.terminate()
 
                 _LOGGER.debug("User inputs are valid")
 
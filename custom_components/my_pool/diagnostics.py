@@ -10,7 +10,17 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.device_registry import DeviceEntry
 
-from .common.consts import DATA_ITEM_CONFIG, DATA_ITEM_MEMBER_DETAILS, DOMAIN, TO_REDACT
+from .common.consts import (
+    DATA_ITEM_API_METRICS,
+    DATA_ITEM_COMMAND_METRICS,
+    DATA_ITEM_CONFIG,
+    DATA_ITEM_HEDGING_METRICS,
+    DATA_ITEM_MEMBER_DETAILS,
+    DATA_ITEM_RATE_LIMIT_METRICS,
+    DATA_ITEM_WRITE_METRICS,
+    DOMAIN,
+    TO_REDACT,
+)
 from .managers.coordinator import Coordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -53,6 +63,11 @@ def _async_get_diagnostics(
             coordinator.member_details, TO_REDACT
         ),
         DATA_ITEM_CONFIG: async_redact_data(coordinator.config_data, TO_REDACT),
+        DATA_ITEM_API_METRICS: coordinator.update_metrics,
+        DATA_ITEM_WRITE_METRICS: coordinator.write_metrics,
+        DATA_ITEM_COMMAND_METRICS: coordinator.command_metrics,
+        DATA_ITEM_RATE_LIMIT_METRICS: coordinator.rate_limit_metrics,
+        DATA_ITEM_HEDGING_METRICS: coordinator.hedging_metrics,
         "disabled_by": entry.disabled_by,
         "disabled_polling": entry.pref_disable_polling,
     }
@@ -0,0 +1,134 @@
+import logging
+
+from aiohttp import ClientSession, TCPConnector
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
+from homeassistant.util.ssl import get_default_context
+
+from ..common.consts import (
+    API_CONNECTION_LIMIT,
+    API_DNS_CACHE_TTL,
+    API_KEEPALIVE_TIMEOUT,
+    DATA_ACCOUNT_REGISTRY,
+)
+from .config_manager import ConfigManager
+from .rate_limiter import RateLimiter
+from .rest_api import RestAPI
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AccountRegistry:
+    """Share a single API client per account across config entries.
+
+    All clients use the same HTTP connection pool and rate limiter.
+    """
+
+    _hass: HomeAssistant
+    _session: ClientSession | None
+    _remove_close_listener: CALLBACK_TYPE | None
+    _rate_limiter: RateLimiter
+    _apis: dict[str, RestAPI]
+    _config_managers: dict[str, dict[str, ConfigManager]]
+
+    def __init__(self, hass: HomeAssistant):
+        self._hass = hass
+
+        self._session = None
+        self._remove_close_listener = None
+        self._rate_limiter = RateLimiter()
+        self._apis = {}
+        self._config_managers = {}
+
+    @staticmethod
+    def get_instance(hass: HomeAssistant) -> "AccountRegistry":
+        registry = hass.data.get(DATA_ACCOUNT_REGISTRY)
+
+        if registry is None:
+            registry = AccountRegistry(hass)
+
+            hass.data[DATA_ACCOUNT_REGISTRY] = registry
+
+        return registry
+
+    def acquire(self, config_manager: ConfigManager) -> RestAPI:
+        """Get the API client of the entry's account, created on first use."""
+        account = config_manager.username
+        api = self._apis.get(account)
+
+        if api is None:
+            api = RestAPI(
+                self._hass, config_manager, self._get_session(), self._rate_limiter
+            )
+
+            self._apis[account] = api
+
+            _LOGGER.debug(f"API client created, Account: {account}")
+
+        account_config_managers = self._config_managers.setdefault(account, {})
+        account_config_managers[config_manager.entry_id] = config_manager
+
+        return api
+
+    async def release(self, config_manager: ConfigManager):
+        """Release the entry's account, last entry terminates the API client."""
+        account = config_manager.username
+        account_config_managers = self._config_managers.get(account, {})
+        account_config_managers.pop(config_manager.entry_id, None)
+
+        api = self._apis.get(account)
+
+        if api is None:
+            return
+
+        if len(account_config_managers) > 0:
+            if api.config_manager == config_manager:
+                # Token of the account is kept by one of the remaining entries
+                await api.set_config_manager(list(account_config_managers.values())[0])
+
+        else:
+            self._apis.pop(account)
+            self._config_managers.pop(account, None)
+
+            await api.terminate()
+
+            _LOGGER.debug(f"API client terminated, Account: {account}")
+
+        if len(self._apis) == 0:
+            await self._close_session()
+
+    def _get_session(self) -> ClientSession:
+        if self._session is None:
+            # Entries are not unloaded when HA stops, session is closed with HA
+            self._remove_close_listener = self._hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_CLOSE, self._on_close
+            )
+
+            connector = TCPConnector(
+                limit_per_host=API_CONNECTION_LIMIT,
+                keepalive_timeout=API_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=API_DNS_CACHE_TTL,
+                enable_cleanup_closed=True,
+                ssl=get_default_context(),
+            )
+
+            self._session = ClientSession(connector=connector)
+
+        return self._session
+
+    async def _on_close(self, _event: Event):
+        self._remove_close_listener = None
+
+        await self._close_session()
+
+    async def _close_session(self):
+        if self._remove_close_listener is not None:
+            self._remove_close_listener()
+
+            self._remove_close_listener = None
+
+        if self._session is not None:
+            await self._session.close()
+
+            self._session = None
@@ -0,0 +1,158 @@
+import logging
+from time import monotonic
+from typing import Any, Awaitable, Callable
+
+from aiohttp import ClientConnectionError, ClientResponseError
+
+from ..common.consts import (
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+    CIRCUIT_BREAKER_STATE_CLOSED,
+    CIRCUIT_BREAKER_STATE_HALF_OPEN,
+    CIRCUIT_BREAKER_STATE_OPEN,
+)
+from ..common.exceptions import CircuitOpenError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Fail fast while the API is unavailable, probe it once recovery time passed."""
+
+    _name: str
+    _failure_threshold: int
+    _recovery_timeout: float
+    _state: str
+    _failures: int
+    _opened_at: float | None
+    _is_probing: bool
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout: float = CIRCUIT_BREAKER_RECOVERY_TIMEOUT.total_seconds(),
+    ):
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+
+        self._state = CIRCUIT_BREAKER_STATE_CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._is_probing = False
+
+    @property
+    def state(self) -> str:
+        result = self._state
+
+        return result
+
+    @property
+    def is_available(self) -> bool:
+        result = (
+            self._state != CIRCUIT_BREAKER_STATE_OPEN or self._is_recovery_time_passed
+        )
+
+        return result
+
+    @property
+    def _is_recovery_time_passed(self) -> bool:
+        result = (
+            self._opened_at is not None
+            and monotonic() - self._opened_at >= self._recovery_timeout
+        )
+
+        return result
+
+    async def execute(self, action: Callable[[], Awaitable[Any]]) -> Any:
+        is_probe = self._before_request()
+
+        try:
+            result = await action()
+
+        except BaseException as ex:
+            self._after_request(ex, is_probe)
+
+            raise ex
+
+        self._after_request(None, is_probe)
+
+        return result
+
+    def _before_request(self) -> bool:
+        """Check whether request is allowed, returns whether it is the probe."""
+        is_probe = False
+
+        if self._state == CIRCUIT_BREAKER_STATE_OPEN:
+            if not self._is_recovery_time_passed:
+                raise CircuitOpenError(self._name)
+
+            self._set_state(CIRCUIT_BREAKER_STATE_HALF_OPEN)
+
+        if self._state == CIRCUIT_BREAKER_STATE_HALF_OPEN:
+            if self._is_probing:
+                raise CircuitOpenError(self._name)
+
+            self._is_probing = True
+
+            is_probe = True
+
+        return is_probe
+
+    def _after_request(self, ex: BaseException | None, is_probe: bool):
+        # Requests sent before the circuit opened must not release the probe
+        if is_probe:
+            self._is_probing = False
+
+        if ex is None or self._is_reachable_error(ex):
+            self._failures = 0
+
+            self._set_state(CIRCUIT_BREAKER_STATE_CLOSED)
+
+        elif self._is_failure(ex):
+            self._failures += 1
+
+            if (
+                self._state == CIRCUIT_BREAKER_STATE_HALF_OPEN
+                or self._failures >= self._failure_threshold
+            ):
+                self._opened_at = monotonic()
+
+                self._set_state(CIRCUIT_BREAKER_STATE_OPEN)
+
+        elif is_probe and self._state == CIRCUIT_BREAKER_STATE_HALF_OPEN:
+            # Probe did not complete (e.g. cancelled), allow another one
+            self._set_state(CIRCUIT_BREAKER_STATE_OPEN)
+
+    def _set_state(self, state: str):
+        if self._state != state:
+            log_message = (
+                f"Circuit breaker of {self._name} changed state, "
+                f"State: {state}, "
+                f"Failures: {self._failures}"
+            )
+
+            if state == CIRCUIT_BREAKER_STATE_OPEN:
+                _LOGGER.warning(log_message)
+
+            else:
+                _LOGGER.info(log_message)
+
+            self._state = state
+
+    @staticmethod
+    def _is_reachable_error(ex: BaseException) -> bool:
+        result = isinstance(ex, ClientResponseError) and ex.status < 500
+
+        return result
+
+    @staticmethod
+    def _is_failure(ex: BaseException) -> bool:
+        if isinstance(ex, ClientResponseError):
+            result = ex.status >= 500
+
+        else:
+            result = isinstance(ex, (ClientConnectionError, TimeoutError))
+
+        return result
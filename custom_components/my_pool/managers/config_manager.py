@@ -1,4 +1,4 @@
-import json
+from asyncio import Lock
 import logging
 import sys
 
@@ -7,20 +7,21 @@ from cryptography.fernet import Fernet, InvalidToken
 from homeassistant.config_entries import STORAGE_VERSION, ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import translation
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.storage import Store
-from homeassistant.util import slugify
 
 from ..common.consts import (
     CONFIGURATION_FILE,
+    DATA_SHARED_STORAGE,
     DEFAULT_NAME,
-    DOMAIN,
+    ENTRY_CONFIGURATION_FILE,
     STORAGE_DATA_KEY,
     STORAGE_DATA_TOKEN_KEY,
+    STORAGE_SAVE_DELAY,
 )
 from ..common.entity_descriptions import IntegrationEntityDescription
+from .translation_cache import TranslationCache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,8 +31,9 @@ class ConfigManager:
     _crypto: Fernet | None
     _data: dict | None
 
-    _store: Store | None
-    _store_data: dict | None
+    _shared_store: Store | None
+    _shared_store_lock: Lock | None
+    _entry_store: Store | None
     _entry_data: dict | None
     _password: str | None
     _entry_title: str
@@ -39,6 +41,8 @@ class ConfigManager:
 
     _is_set_up_mode: bool
     _is_initialized: bool
+    _is_dirty: bool
+    _translation_cache: TranslationCache | None
 
     def __init__(self, hass: HomeAssistant | None, entry: ConfigEntry | None = None):
         self._hass = hass
@@ -51,13 +55,15 @@ class ConfigManager:
 
         self._password = None
 
-        self._store = None
+        self._shared_store = None
+        self._shared_store_lock = None
+        self._entry_store = None
         self._entry_data = None
-        self._store_data = None
-        self._translations = None
+        self._translation_cache = None
 
         self._is_set_up_mode = entry is None
         self._is_initialized = False
+        self._is_dirty = False
 
         if self._is_set_up_mode:
             self._entry_data = {}
@@ -70,9 +76,35 @@ class ConfigManager:
             self._entry_id = entry.entry_id
 
         if hass is not None:
-            self._store = Store(
-                hass, STORAGE_VERSION, CONFIGURATION_FILE, encoder=JSONEncoder
-            )
+            shared_storage = self._get_shared_storage(hass)
+
+            self._shared_store = shared_storage.get("store")
+            self._shared_store_lock = shared_storage.get("lock")
+
+            if not self._is_set_up_mode:
+                self._entry_store = Store(
+                    hass,
+                    STORAGE_VERSION,
+                    ENTRY_CONFIGURATION_FILE.format(self._entry_id),
+                    encoder=JSONEncoder,
+                )
+
+    @staticmethod
+    def _get_shared_storage(hass: HomeAssistant) -> dict:
+        """Store of the encryption key, shared by all entries."""
+        shared_storage = hass.data.get(DATA_SHARED_STORAGE)
+
+        if shared_storage is None:
+            shared_storage = {
+                "store": Store(
+                    hass, STORAGE_VERSION, CONFIGURATION_FILE, encoder=JSONEncoder
+                ),
+                "lock": Lock(),
+            }
+
+            hass.data[DATA_SHARED_STORAGE] = shared_storage
+
+        return shared_storage
 
     @property
     def is_initialized(self) -> bool:
@@ -138,13 +170,7 @@ class ConfigManager:
             self._data[CONF_USERNAME] = self._entry_data.get(CONF_USERNAME)
             self._data[CONF_PASSWORD] = password
 
-            self._translations = await translation.async_get_translations(
-                self._hass, self._hass.config.language, "entity", {DOMAIN}
-            )
-
-            _LOGGER.debug(
-                f"Translations loaded, Data: {json.dumps(self._translations)}"
-            )
+            self._translation_cache = await TranslationCache.async_get(self._hass)
 
             self._is_initialized = True
 
@@ -166,22 +192,9 @@ class ConfigManager:
     def get_entity_name(
         self, entity_description: IntegrationEntityDescription, device_info: DeviceInfo
     ) -> str:
-        entity_key = slugify(entity_description.key)
-        platform = entity_description.platform
-
+        translated_name = self._translation_cache.get_entity_name(entity_description)
         device_name = device_info.get("name")
 
-        translation_key = f"component.{DOMAIN}.entity.{platform}.{entity_key}.name"
-
-        translated_name = self._translations.get(
-            translation_key, entity_description.name
-        )
-
-        _LOGGER.debug(
-            f"Translations requested '{device_name}', Key: {translation_key}, "
-            f"Entity: {entity_description.name}, Value: {translated_name}"
-        )
-
         entity_name = (
             device_name
             if translated_name is None or translated_name == ""
@@ -194,81 +207,134 @@ class ConfigManager:
         self._entry_data = data
 
     async def update_token_key(self, key: str | None):
+        if self._data.get(STORAGE_DATA_TOKEN_KEY) == key:
+            return
+
         self._data[STORAGE_DATA_TOKEN_KEY] = key
 
-        await self._save()
+        self._delay_save()
+
+    async def flush(self):
+        """Write pending changes, instead of waiting for the delayed save."""
+        if self._is_dirty:
+            await self._save()
 
     async def _load(self):
         self._data = None
 
-        await self._load_config_from_file()
-        await self._load_encryption_key()
+        if self._shared_store is not None:
+            async with self._shared_store_lock:
+                shared_data = await self._shared_store.async_load()
+                is_shared_data_changed = shared_data is None
+
+                if shared_data is None:
+                    shared_data = {}
+
+                if self._load_encryption_key(shared_data):
+                    is_shared_data_changed = True
+
+                if self._entry_store is not None:
+                    self._data = await self._entry_store.async_load()
+
+                    if self._data is None and self._entry_id in shared_data:
+                        await self._migrate_entry_configuration(shared_data)
+
+                        is_shared_data_changed = True
+
+                if is_shared_data_changed:
+                    await self._shared_store.async_save(shared_data)
+
+        else:
+            self._load_encryption_key({})
 
         if self._data is None:
             self._data = {STORAGE_DATA_TOKEN_KEY: None}
 
             await self._save()
 
-    async def _load_config_from_file(self):
-        if self._store is not None:
-            self._store_data = await self._store.async_load()
+    async def _migrate_entry_configuration(self, shared_data: dict):
+        """Move configuration of the entry from the shared file into its own."""
+        self._data = shared_data.pop(self._entry_id)
 
-            if self._store_data is not None:
-                self._data = self._store_data.get(self._entry_id)
+        await self._entry_store.async_save(self._get_entry_store_data())
 
-    async def _load_encryption_key(self):
-        if self._store_data is not None:
-            if STORAGE_DATA_KEY in self._store_data:
-                self._encryption_key = self._store_data.get(STORAGE_DATA_KEY)
+        _LOGGER.info(f"Configuration migrated, Entry ID: {self._entry_id}")
 
-            else:
-                for store_data_key in self._store_data:
-                    if store_data_key == self._entry_id:
-                        entry_configuration = self._store_data[store_data_key]
+    def _load_encryption_key(self, shared_data: dict) -> bool:
+        """Load encryption key, returns whether the shared data was changed."""
+        is_changed = False
 
-                        if STORAGE_DATA_KEY in entry_configuration:
-                            self._encryption_key = entry_configuration.get(
-                                STORAGE_DATA_KEY
-                            )
+        if STORAGE_DATA_KEY in shared_data:
+            self._encryption_key = shared_data.get(STORAGE_DATA_KEY)
 
-                            entry_configuration.pop(STORAGE_DATA_KEY)
+        else:
+            entry_configuration = shared_data.get(self._entry_id)
+
+            if entry_configuration is not None:
+                self._encryption_key = entry_configuration.pop(STORAGE_DATA_KEY, None)
+
+            if self._encryption_key is None:
+                self._encryption_key = Fernet.generate_key().decode("utf-8")
 
-        if self._encryption_key is None:
-            self._encryption_key = Fernet.generate_key().decode("utf-8")
+            shared_data[STORAGE_DATA_KEY] = self._encryption_key
+
+            is_changed = True
 
         self._crypto = Fernet(self._encryption_key.encode())
 
+        return is_changed
+
     async def remove(self):
-        if self._entry_id in self._store_data:
+        """Remove stored configuration of the entry, e.g. once it was deleted."""
+        if self._entry_store is not None:
             self._is_set_up_mode = True
+            self._is_dirty = False
 
-            self._store_data.pop(self._entry_id)
+            await self._entry_store.async_remove()
 
-            await self._save()
+            # Configuration of an entry not migrated yet is in the shared file
+            async with self._shared_store_lock:
+                shared_data = await self._shared_store.async_load()
+
+                if shared_data is not None and self._entry_id in shared_data:
+                    shared_data.pop(self._entry_id)
+
+                    await self._shared_store.async_save(shared_data)
+
+            _LOGGER.info(f"Configuration removed, Entry ID: {self._entry_id}")
 
     async def _save(self):
-        if self._store is None:
+        if self._entry_store is None or self._is_set_up_mode:
             return
 
-        if self._store_data is None:
-            self._store_data = {STORAGE_DATA_KEY: self._encryption_key}
+        await self._entry_store.async_save(self._get_entry_store_data())
+
+        self._is_dirty = False
 
-        elif STORAGE_DATA_KEY not in self._store_data:
-            self._store_data[STORAGE_DATA_KEY] = self._encryption_key
+    def _delay_save(self):
+        """Coalesce changes into a single write, pending write is flushed on stop."""
+        if self._entry_store is None or self._is_set_up_mode:
+            return
+
+        self._is_dirty = True
+
+        self._entry_store.async_delay_save(
+            self._get_delayed_store_data, STORAGE_SAVE_DELAY.total_seconds()
+        )
 
-        if not self._is_set_up_mode:
-            if self._entry_id not in self._store_data:
-                self._store_data[self._entry_id] = {}
+    def _get_delayed_store_data(self) -> dict:
+        self._is_dirty = False
 
-            for key in self._data:
-                if key not in [CONF_PASSWORD, CONF_USERNAME]:
-                    self._store_data[self._entry_id][key] = self._data[key]
+        return self._get_entry_store_data()
 
-            for key in [CONF_PASSWORD, CONF_USERNAME]:
-                if key in self._store_data[self._entry_id]:
-                    self._store_data[self._entry_id].pop(key)
+    def _get_entry_store_data(self) -> dict:
+        entry_store_data = {
+            key: self._data[key]
+            for key in self._data
+            if key not in [CONF_PASSWORD, CONF_USERNAME]
+        }
 
-        await self._store.async_save(self._store_data)
+        return entry_store_data
 
     def _encrypt(self, data: str) -> str:
         if data is not None:
@@ -1,9 +1,19 @@
+from asyncio import Future
+from collections import deque
+from datetime import timedelta
+from functools import partial
 import logging
+from math import ceil
+from random import uniform
 import sys
-from typing import Any, Callable
+from time import monotonic
+from typing import Any, Callable, Mapping
+from zlib import crc32
 
-from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import ATTR_STATE, Platform
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity import DeviceInfo, EntityDescription
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
@@ -12,20 +22,29 @@ from ..common.consts import (
     ACTION_ENTITY_SET_NATIVE_VALUE,
     ACTION_ENTITY_TURN_OFF,
     ACTION_ENTITY_TURN_ON,
+    API_REQUESTS_BUDGET_PER_HOUR,
+    API_STATUS,
     ATTR_ACTIONS,
     ATTR_IS_ON,
+    AUTOMATION_CHANNELS,
     CONFIG_TECHNICIAN_POOL_SIZE,
     DATA_ITEM_CONFIG,
     DATA_ITEM_DEVICES,
     DATA_ITEM_MEMBER_DETAILS,
+    DERIVED_KEY_DEPENDENCIES,
+    DEVICE_REFRESH_COOLDOWN,
     DOMAIN,
+    IS_DEVICE_CONNECTED,
     MANUFACTURER,
     MAXIMUM_SALINITY_PPM,
+    METRICS_SAMPLES,
     MINIMUM_SALINITY_PPM,
     NORMAL_SALINITY_PPM_RANGE,
+    PENDING_WRITE_TIMEOUT,
     PREFERRED_SALINITY_PPM,
     PRODUCT_PAGE,
     PRODUCT_URL,
+    RUNTIME_AUTOMATION_STATE_CHANNEL_TIMELEFT,
     RUNTIME_DEVICE_ON,
     RUNTIME_DEVICE_TURBO,
     RUNTIME_DEVICE_TURBO_TIME,
@@ -33,18 +52,29 @@ from ..common.consts import (
     SALINITY_STATUS,
     SALT_MISSING,
     SALT_WEIGHT_FOR_PREFERRED_SALINITY,
-    UNIT_PH,
+    SIGNAL_DEVICE_NEW,
     UPDATE_API,
+    UPDATE_API_ACTIVE,
+    UPDATE_API_JITTER,
+    UPDATE_API_MIN_INTERVAL,
+    UPDATE_API_OFFLINE_MAX,
 )
 from ..common.entity_descriptions import (
     DEFAULT_ENTITY_DESCRIPTIONS,
     IntegrationEntityDescription,
 )
+from ..common.value_decoders import get_value_decoder, get_value_encoder
+from .account_registry import AccountRegistry
 from .config_manager import ConfigManager
 from .rest_api import RestAPI
 
 _LOGGER = logging.getLogger(__name__)
 
+AUTOMATION_TIME_LEFT_KEYS = [
+    RUNTIME_AUTOMATION_STATE_CHANNEL_TIMELEFT.replace("*", str(i))
+    for i in range(1, AUTOMATION_CHANNELS + 1)
+]
+
 
 class Coordinator(DataUpdateCoordinator):
     """My custom coordinator."""
@@ -53,6 +83,24 @@ class Coordinator(DataUpdateCoordinator):
     _data_retrievers: dict[Platform, Callable[[int, int, Any], dict]] | None
     _api: RestAPI | None
     _config_manager: ConfigManager
+    _device_next_update: dict[int, float]
+    _device_offline_updates: dict[int, int]
+    _device_refresh_debouncers: dict[int, Debouncer]
+    _device_listeners: dict[int, dict[str, list[CALLBACK_TYPE]]]
+    _device_changes: dict[int, set[str]]
+    _is_update_success_notified: bool
+    _pending_writes: dict[int, dict[str, dict]]
+    _confirmation_latencies: deque[float]
+    _write_metrics: dict
+    _value_decoders: dict[str, Callable[[int, Any], Any]] | None
+    _value_encoders: dict[str, Callable[[Any], Any]] | None
+    _platform_actions: dict[Platform, dict[str, Callable]] | None
+    _device_states: dict[int, dict[str, dict | None]]
+    _device_generations: dict[int, int]
+    _device_payloads: dict[int, Mapping | None]
+    _device_identities: dict[int, dict]
+    _dispatched_devices: list[int]
+    _remove_api_listener: Callable[[], None] | None
 
     def __init__(
         self,
@@ -70,9 +118,32 @@ class Coordinator(DataUpdateCoordinator):
 
         self._config_manager = config_manager
 
-        self._api = RestAPI(hass, config_manager)
+        self._api = AccountRegistry.get_instance(hass).acquire(config_manager)
         self._entity_descriptions = None
         self._data_retrievers = None
+        self._value_decoders = None
+        self._value_encoders = None
+        self._platform_actions = None
+
+        self._device_states = {}
+        self._device_generations = {}
+        self._device_payloads = {}
+        self._device_identities = {}
+
+        self._device_next_update = {}
+        self._device_offline_updates = {}
+
+        self._device_refresh_debouncers = {}
+        self._device_listeners = {}
+        self._device_changes = {}
+        self._is_update_success_notified = True
+
+        self._pending_writes = {}
+        self._confirmation_latencies = deque(maxlen=METRICS_SAMPLES)
+        self._write_metrics = {"confirmed": 0, "rolled_back": 0}
+
+        self._dispatched_devices = []
+        self._remove_api_listener = None
 
     @property
     def api(self) -> RestAPI:
@@ -90,6 +161,39 @@ class Coordinator(DataUpdateCoordinator):
     def member_details(self):
         return self._api.member_details
 
+    @property
+    def update_metrics(self):
+        return self._api.update_metrics
+
+    @property
+    def command_metrics(self) -> dict:
+        return self._api.command_metrics
+
+    @property
+    def hedging_metrics(self) -> dict:
+        return self._api.hedging_metrics
+
+    @property
+    def rate_limit_metrics(self) -> dict:
+        return self._api.rate_limit_metrics
+
+    @property
+    def write_metrics(self) -> dict:
+        latencies = self._confirmation_latencies
+        average_latency = None
+
+        if len(latencies) > 0:
+            average_latency = round(sum(latencies) / len(latencies), 3)
+
+        result = {
+            **self._write_metrics,
+            "pending": sum(len(writes) for writes in self._pending_writes.values()),
+            "average_confirmation_latency": average_latency,
+            "max_confirmation_latency": None if len(latencies) == 0 else max(latencies),
+        }
+
+        return result
+
     @property
     def platforms(self) -> list[Platform]:
         return list(self._entity_descriptions.keys())
@@ -103,8 +207,33 @@ class Coordinator(DataUpdateCoordinator):
 
         return entity_descriptions
 
-    def get_device(self, device_id: int) -> DeviceInfo:
+    def get_device(self, device_id: int) -> DeviceInfo | None:
+        device_identity = self.get_device_identity(device_id)
+        device_info = (
+            None if device_identity is None else device_identity.get("device_info")
+        )
+
+        return device_info
+
+    def get_device_identity(self, device_id: int) -> dict | None:
+        """Device info, serial number and unique ID prefix per platform."""
+        device_identity = self._device_identities.get(device_id)
+
+        if device_identity is None:
+            device_identity = self._update_device_identity(device_id)
+
+        return device_identity
+
+    def _update_device_identity(self, device_id: int) -> dict | None:
+        """Build the identity of the device, again only once its metadata changed."""
         device_data = self._api.get_device_data(device_id)
+
+        if device_data is None:
+            # Device was removed from the inventory
+            self._device_identities.pop(device_id, None)
+
+            return None
+
         metadata = device_data.get("metadata")
 
         nick_name = metadata.get("nickname")
@@ -113,46 +242,588 @@ class Coordinator(DataUpdateCoordinator):
         device_type = metadata.get("deviceType")
         version = metadata.get("firmware-main-current")
 
-        product_page = PRODUCT_PAGE.get(device_type, "")
-        product_url = f"{PRODUCT_URL}{product_page}"
+        identity_metadata = (nick_name, serial_number, device_type, version)
 
-        device_name = serial_number if nick_name is None else nick_name
+        device_identity = self._device_identities.get(device_id)
 
-        device_info = DeviceInfo(
-            identifiers={(DOMAIN, str(device_id))},
-            name=device_name,
-            manufacturer=MANUFACTURER,
-            model=device_type,
-            hw_version=version,
-            configuration_url=product_url,
-        )
+        if (
+            device_identity is None
+            or device_identity.get("metadata") != identity_metadata
+        ):
+            product_page = PRODUCT_PAGE.get(device_type, "")
+            product_url = f"{PRODUCT_URL}{product_page}"
 
-        return device_info
+            device_name = serial_number if nick_name is None else nick_name
+            identifier = str(device_id)
+
+            device_info = DeviceInfo(
+                identifiers={(DOMAIN, identifier)},
+                name=device_name,
+                manufacturer=MANUFACTURER,
+                model=device_type,
+                hw_version=version,
+                configuration_url=product_url,
+            )
+
+            device_identity = {
+                "metadata": identity_metadata,
+                "device_info": device_info,
+                "serial_number": identifier,
+                "unique_id_prefixes": {
+                    platform: f"{platform}_{identifier}_"
+                    for platform in self._entity_descriptions
+                },
+            }
+
+            self._device_identities[device_id] = device_identity
+
+        return device_identity
 
     async def initialize(self):
         self._load_data_retrievers()
         self._load_entity_descriptions()
 
+        self._remove_api_listener = self._api.add_update_listener(self._on_api_update)
+
         await self._api.initialize()
 
+    async def terminate(self):
+        if self._remove_api_listener is not None:
+            self._remove_api_listener()
+
+        for device_id in self._device_refresh_debouncers:
+            self._device_refresh_debouncers[device_id].async_cancel()
+
+        await AccountRegistry.get_instance(self.hass).release(self._config_manager)
+
+        await self._config_manager.flush()
+
+    @callback
+    def async_add_device_listener(
+        self, device_id: int, update_callback: CALLBACK_TYPE, keys: list[str]
+    ) -> Callable[[], None]:
+        """Listen for changes of specific keys of a single device."""
+        device_listeners = self._device_listeners.setdefault(device_id, {})
+
+        for key in keys:
+            device_listeners.setdefault(key, []).append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            for listener_key in keys:
+                device_listeners[listener_key].remove(update_callback)
+
+        return remove_listener
+
+    @staticmethod
+    def get_source_keys(entity_description: IntegrationEntityDescription) -> list[str]:
+        """Keys of the device data the entity state is calculated from."""
+        key = entity_description.key
+        result = [key, *DERIVED_KEY_DEPENDENCIES.get(key, [])]
+
+        return result
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all entities only when availability changed, changed otherwise."""
+        if self._is_update_success_notified != self.last_update_success:
+            self._is_update_success_notified = self.last_update_success
+            self._device_changes = {}
+
+            super().async_update_listeners()
+
+        else:
+            self._async_update_changed_device_listeners()
+
+    async def async_request_device_refresh(self, device_id: int):
+        """Refresh a single device, requests within the cooldown are collapsed."""
+        debouncer = self._device_refresh_debouncers.get(device_id)
+
+        if debouncer is None:
+            debouncer = Debouncer(
+                self.hass,
+                _LOGGER,
+                cooldown=DEVICE_REFRESH_COOLDOWN.total_seconds(),
+                immediate=False,
+                function=partial(self._async_refresh_device, device_id),
+            )
+
+            self._device_refresh_debouncers[device_id] = debouncer
+
+        await debouncer.async_call()
+
+    async def _async_refresh_device(self, device_id: int):
+        await self._api.update_device(device_id, self._on_api_update)
+
+        self._process_device_updates([device_id])
+
+        self._async_update_changed_device_listeners()
+
+    @callback
+    def _on_api_update(self, device_ids: list[int]):
+        """Devices were fetched by another entry of the account."""
+        self._process_device_updates(device_ids)
+
+        self.async_set_updated_data(self._get_update_data())
+
+    def _process_device_updates(self, device_ids: list[int]):
+        # Devices fetched by another entry of the account before this one was set up
+        device_ids = device_ids + [
+            device_id
+            for device_id in self._api.devices
+            if device_id not in self._device_states
+            and device_id not in device_ids
+            and self._get_device_state(device_id) is not None
+        ]
+
+        self._schedule_device_updates(device_ids)
+
+        for device_id in device_ids:
+            device_identity = self._update_device_identity(device_id)
+
+            if device_identity is None:
+                self._remove_device_states(device_id)
+
+                continue
+
+            settled_keys = self._confirm_pending_writes(device_id)
+            changed_keys = self._update_entity_states(device_id)
+
+            self._add_device_changes(device_id, changed_keys.union(settled_keys))
+
+        self._update_api_status_states()
+
+        self._dispatch_new_devices()
+
+    def _update_entity_states(self, device_id: int) -> set[str]:
+        """Compute states of all entities of the device, once per device change.
+
+        Returns the keys of the device data changed since the last computation.
+        """
+        device_states = {}
+        data = self._get_device_state(device_id)
+        previous_data = self._device_payloads.get(device_id)
+
+        if data is previous_data:
+            changed_keys = set()
+
+        elif previous_data is None:
+            changed_keys = set(data.keys())
+
+        elif data is None:
+            changed_keys = set(previous_data.keys())
+
+        else:
+            changed_keys = {
+                key
+                for key in data.keys() | previous_data.keys()
+                if data.get(key) != previous_data.get(key)
+            }
+
+        for platform in self._entity_descriptions:
+            data_retriever = self._data_retrievers.get(platform)
+
+            for entity_description in self._entity_descriptions[platform]:
+                device_states[entity_description.key] = self._get_entity_state(
+                    device_id, data, entity_description, data_retriever
+                )
+
+        # API status is not part of the device data, compared to its last state
+        previous_states = self._device_states.get(device_id)
+        api_status_state = device_states.get(API_STATUS)
+
+        if (
+            previous_states is not None
+            and previous_states.get(API_STATUS) != api_status_state
+        ):
+            changed_keys.add(API_STATUS)
+
+        self._device_states[device_id] = device_states
+        self._device_payloads[device_id] = data
+        self._device_generations[device_id] = (
+            self._device_generations.get(device_id, 0) + 1
+        )
+
+        for removed_device_id in list(self._device_states.keys()):
+            if removed_device_id not in self._api.devices:
+                self._remove_device_states(removed_device_id)
+
+        return changed_keys
+
+    def _remove_device_states(self, device_id: int):
+        """Drop everything computed for a device removed from the inventory."""
+        self._device_states.pop(device_id, None)
+        self._device_payloads.pop(device_id, None)
+        self._device_generations.pop(device_id, None)
+        self._device_identities.pop(device_id, None)
+
+    def _update_api_status_states(self):
+        """API status is not part of the device data, updated once it changed."""
+        api_status = self._api.circuit_breaker_state
+
+        for device_id in self._device_states:
+            device_states = self._device_states[device_id]
+            api_status_state = device_states.get(API_STATUS)
+
+            if (
+                api_status_state is not None
+                and api_status_state.get(ATTR_STATE) != api_status
+            ):
+                device_states[API_STATUS] = {ATTR_STATE: api_status}
+
+                self._device_generations[device_id] += 1
+
+                self._add_device_changes(device_id, {API_STATUS})
+
+    def _add_device_changes(self, device_id: int, changed_keys: set[str]):
+        if len(changed_keys) > 0:
+            device_changes = self._device_changes.setdefault(device_id, set())
+            device_changes.update(changed_keys)
+
+    @callback
+    def _async_update_changed_device_listeners(self):
+        device_changes = self._device_changes
+        self._device_changes = {}
+
+        for device_id in device_changes:
+            self._async_update_device_listeners(device_id, device_changes[device_id])
+
+    def _get_entity_state(
+        self,
+        device_id: int,
+        data: dict | None,
+        entity_description: IntegrationEntityDescription,
+        data_retriever: Callable,
+    ) -> dict | None:
+        try:
+            state = None if data is None else data.get(entity_description.key)
+
+            pending_write = self._get_pending_write(device_id, entity_description.key)
+
+            if pending_write is not None:
+                state = pending_write.get("value")
+
+            result = data_retriever(device_id, state, entity_description)
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(
+                f"Failed to extract data for {entity_description}, Error: {ex}, Line: {line_number}"
+            )
+
+            result = None
+
+        return result
+
+    def _dispatch_new_devices(self):
+        for device_id in self._api.devices:
+            is_new = device_id not in self._dispatched_devices
+
+            if is_new and self._get_device_state(device_id) is not None:
+                self._dispatched_devices.append(device_id)
+
+                async_dispatcher_send(
+                    self.hass,
+                    SIGNAL_DEVICE_NEW,
+                    self._config_manager.entry_id,
+                    device_id,
+                )
+
+    def _get_update_data(self) -> dict:
+        result = {
+            DATA_ITEM_DEVICES: self._api.devices,
+            DATA_ITEM_MEMBER_DETAILS: self._api.member_details,
+            DATA_ITEM_CONFIG: self.config_data,
+        }
+
+        return result
+
+    @callback
+    def _async_update_device_listeners(self, device_id: int, changed_keys: set[str]):
+        device_listeners = self._device_listeners.get(device_id, {})
+
+        # Entity depending on several changed keys is updated once
+        update_callbacks = {
+            update_callback: None
+            for key in changed_keys
+            for update_callback in device_listeners.get(key, [])
+        }
+
+        for update_callback in update_callbacks:
+            update_callback()
+
+    def _set_pending_write(self, device_id: int, key: str, value: Any):
+        """Apply written value locally until the device reports it."""
+        device_pending_writes = self._pending_writes.setdefault(device_id, {})
+        device_pending_writes[key] = {"value": value, "written_at": monotonic()}
+
+        changed_keys = self._update_entity_states(device_id)
+        self._async_update_device_listeners(device_id, changed_keys.union({key}))
+
+    def _get_pending_write(self, device_id: int, key: str) -> dict | None:
+        device_pending_writes = self._pending_writes.get(device_id)
+
+        pending_write = (
+            None if device_pending_writes is None else device_pending_writes.get(key)
+        )
+
+        return pending_write
+
+    def _confirm_pending_writes(self, device_id: int) -> set[str]:
+        """Confirm pending writes reported by device, roll back expired ones.
+
+        Returns the keys of the settled writes.
+        """
+        settled_keys = set()
+        device_pending_writes = self._pending_writes.get(device_id)
+
+        if device_pending_writes is None:
+            return settled_keys
+
+        data = self._get_device_state(device_id)
+        now = monotonic()
+
+        for key in list(device_pending_writes.keys()):
+            pending_write = device_pending_writes[key]
+            value = pending_write.get("value")
+            latency = now - pending_write.get("written_at")
+
+            if data is not None and self._is_value_reported(key, data.get(key), value):
+                device_pending_writes.pop(key)
+                settled_keys.add(key)
+
+                self._confirmation_latencies.append(round(latency, 3))
+                self._write_metrics["confirmed"] += 1
+
+                _LOGGER.debug(
+                    f"Write confirmed, "
+                    f"Device: {device_id}, "
+                    f"Key: {key}, "
+                    f"Value: {value}, "
+                    f"Latency: {latency:.3f}s"
+                )
+
+            elif latency >= PENDING_WRITE_TIMEOUT.total_seconds():
+                device_pending_writes.pop(key)
+                settled_keys.add(key)
+
+                self._write_metrics["rolled_back"] += 1
+
+                _LOGGER.warning(
+                    f"Write was not applied by device, rolling back, "
+                    f"Device: {device_id}, "
+                    f"Key: {key}, "
+                    f"Value: {value}, "
+                    f"Reported: {None if data is None else data.get(key)}"
+                )
+
+        if len(device_pending_writes) == 0:
+            self._pending_writes.pop(device_id)
+
+        return settled_keys
+
+    def _is_value_reported(self, key: str, reported_value: Any, value: Any) -> bool:
+        """Compare in device units, encoded values compared once decoded."""
+        result = str(reported_value) == str(value)
+
+        value_decoder = self._value_decoders.get(key)
+
+        if not result and value_decoder is not None and reported_value is not None:
+            result = value_decoder(None, reported_value) == value_decoder(None, value)
+
+        return result
+
     async def _async_update_data(self):
         """Fetch parameters from API endpoint.
 
         This is the place to pre-process the parameters to lookup tables
         so entities can quickly look up their parameters.
         """
+        due_device_ids = [
+            device_id
+            for device_id in self._api.devices
+            if self._is_device_update_due(device_id)
+        ]
+
         try:
-            await self._api.update()
+            device_ids = await self._api.update(
+                self._is_device_update_due, self._on_api_update
+            )
 
-            return {
-                DATA_ITEM_DEVICES: self._api.devices,
-                DATA_ITEM_MEMBER_DETAILS: self._api.member_details,
-                DATA_ITEM_CONFIG: self.config_data,
-            }
+            self._process_device_updates(device_ids)
+
+            return self._get_update_data()
 
         except Exception as err:
             raise UpdateFailed(f"Error communicating with API: {err}")
 
+        finally:
+            self._postpone_device_updates(due_device_ids)
+
+    def _is_device_update_due(self, device_id: int) -> bool:
+        next_update = self._device_next_update.get(device_id)
+        is_due = next_update is None or next_update <= monotonic()
+
+        return is_due
+
+    def _schedule_device_updates(self, updated_device_ids: list[int]):
+        """Schedule next update of each device by its state, within the budget."""
+        now = monotonic()
+
+        for device_id in updated_device_ids:
+            if self._is_device_connected(device_id):
+                self._device_offline_updates.pop(device_id, None)
+
+            else:
+                offline_updates = self._device_offline_updates.get(device_id, 0)
+                self._device_offline_updates[device_id] = offline_updates + 1
+
+        intervals = self._get_device_update_intervals()
+
+        for device_id in updated_device_ids:
+            if device_id in intervals:
+                self._device_next_update[device_id] = self._get_device_next_update(
+                    device_id, intervals[device_id], now
+                )
+
+        for device_id in list(self._device_next_update.keys()):
+            if device_id not in intervals:
+                self._device_next_update.pop(device_id)
+                self._device_offline_updates.pop(device_id, None)
+
+        self._update_interval_by_schedule(now)
+
+    def _postpone_device_updates(self, due_device_ids: list[int]):
+        """Devices not fetched when due (e.g. login failed) wait a whole interval.
+
+        Otherwise their past update time would repeat the update at the minimum
+        interval, regardless of the requests budget.
+        """
+        now = monotonic()
+        intervals = self._get_device_update_intervals()
+        postponed_device_ids = []
+
+        for device_id in due_device_ids:
+            if device_id in intervals and self._is_device_update_due(device_id):
+                self._device_next_update[device_id] = self._get_device_next_update(
+                    device_id, intervals[device_id], now
+                )
+
+                postponed_device_ids.append(device_id)
+
+        if len(postponed_device_ids) > 0:
+            _LOGGER.debug(
+                f"Devices were not updated, postponed: {postponed_device_ids}"
+            )
+
+            self._update_interval_by_schedule(now)
+
+    def _get_device_update_intervals(self) -> dict[int, float]:
+        """Update interval of each device, stretched to fit the requests budget."""
+        intervals = {
+            device_id: self._get_device_update_interval(device_id)
+            for device_id in self._api.devices
+        }
+
+        requests_per_hour = sum(3600 / intervals[device_id] for device_id in intervals)
+        budget_factor = max(requests_per_hour / API_REQUESTS_BUDGET_PER_HOUR, 1)
+
+        result = {
+            device_id: intervals[device_id] * budget_factor for device_id in intervals
+        }
+
+        _LOGGER.debug(
+            f"Devices update intervals, "
+            f"Requests per hour: {requests_per_hour / budget_factor:.1f}, "
+            f"Budget factor: {budget_factor:.2f}"
+        )
+
+        return result
+
+    def _update_interval_by_schedule(self, now: float):
+        next_update_in = UPDATE_API.total_seconds()
+
+        if len(self._device_next_update) > 0:
+            next_update_in = min(
+                next_update_in, min(self._device_next_update.values()) - now
+            )
+
+        next_update_in = max(next_update_in, UPDATE_API_MIN_INTERVAL.total_seconds())
+
+        self.update_interval = timedelta(seconds=next_update_in)
+
+        _LOGGER.debug(
+            f"Devices update scheduled, Next update in: {next_update_in:.0f}s"
+        )
+
+    @staticmethod
+    def _get_device_next_update(device_id: int, interval: float, now: float) -> float:
+        """Align device update to its own phase within the interval, with jitter.
+
+        Phase is derived from the device ID, so devices are spread evenly over the
+        interval instead of being fetched together, time between updates of a
+        device is kept between half and one and a half of the interval.
+        """
+        phase = crc32(str(device_id).encode()) / 0xFFFFFFFF * interval
+        earliest_update = now + interval / 2
+
+        next_update = ceil((earliest_update - phase) / interval) * interval + phase
+        jitter = uniform(-1, 1) * interval * UPDATE_API_JITTER
+
+        result = max(next_update + jitter, earliest_update)
+
+        return result
+
+    def _get_device_update_interval(self, device_id: int) -> float:
+        interval = UPDATE_API.total_seconds()
+        offline_updates = self._device_offline_updates.get(device_id, 0)
+
+        if offline_updates > 0:
+            interval = min(
+                interval * (2 ** (offline_updates - 1)),
+                UPDATE_API_OFFLINE_MAX.total_seconds(),
+            )
+
+        elif self._is_device_active(device_id):
+            interval = UPDATE_API_ACTIVE.total_seconds()
+
+        return interval
+
+    def _get_device_state(self, device_id: int) -> dict | None:
+        device_data = self._api.get_device_data(device_id)
+        data = None if device_data is None else device_data.get("data")
+
+        return data
+
+    def _is_device_connected(self, device_id: int) -> bool:
+        data = self._get_device_state(device_id)
+
+        is_connected = (
+            data is not None
+            and str(data.get(IS_DEVICE_CONNECTED)).lower() == str(True).lower()
+        )
+
+        return is_connected
+
+    def _is_device_active(self, device_id: int) -> bool:
+        """Device is active while turbo is on or automation is counting down."""
+        data = self._get_device_state(device_id)
+
+        if data is None:
+            return False
+
+        is_active = str(data.get(RUNTIME_DEVICE_TURBO)) == "1"
+
+        for key in AUTOMATION_TIME_LEFT_KEYS:
+            time_left = str(data.get(key))
+
+            if time_left.isdigit() and int(time_left) > 0:
+                is_active = True
+
+        return is_active
+
     def get_device_action(
         self,
         entity_description,
@@ -176,47 +847,58 @@ class Coordinator(DataUpdateCoordinator):
 
         self._data_retrievers = data_retrievers
 
+        # Shared by all entities of the platform, not allocated per state
+        self._platform_actions = {
+            Platform.SELECT: {ACTION_ENTITY_SELECT_OPTION: self._handle_select_action},
+            Platform.SWITCH: {
+                ACTION_ENTITY_TURN_ON: self._handle_turn_on_action,
+                ACTION_ENTITY_TURN_OFF: self._handle_turn_off_action,
+            },
+            Platform.NUMBER: {
+                ACTION_ENTITY_SET_NATIVE_VALUE: self._handle_set_number_action
+            },
+        }
+
     def _sensor_state_handler(
         self, device_id: int | None, state: int, entity_description
     ):
-        if entity_description.device_class == SensorDeviceClass.TEMPERATURE:
-            state_str = str(state)
-            state_str_fixed = f"{state_str[:2]}.{state_str[2:].ljust(2, '0')}"
-            state = float(state_str_fixed)
+        value_decoder = self._value_decoders.get(entity_description.key)
 
-        elif entity_description.device_class == SensorDeviceClass.SIGNAL_STRENGTH:
-            state = (state / 2) - 110
+        if value_decoder is not None:
+            state = value_decoder(device_id, state)
 
-        elif entity_description.native_unit_of_measurement == UNIT_PH:
-            state_str = str(state)
-            state_str_fixed = f"{state_str[:1]}.{state_str[1:].ljust(2, '0')}"
-            state = float(state_str_fixed)
+        result = {ATTR_STATE: state}
 
-        elif entity_description.key == SALT_MISSING:
-            device_data = self._api.get_device_data(device_id)
-            data = device_data.get("data")
+        return result
 
-            pool_size = data.get(CONFIG_TECHNICIAN_POOL_SIZE)
-            current_salinity = data.get(RUNTIME_SALINITY_VALUE)
+    def _decode_missing_salt(self, device_id: int, _state: int) -> float:
+        data = self._get_device_state(device_id)
 
-            state = self._get_missing_salt(pool_size, current_salinity)
+        pool_size = data.get(CONFIG_TECHNICIAN_POOL_SIZE)
+        current_salinity = data.get(RUNTIME_SALINITY_VALUE)
 
-        elif entity_description.key == SALINITY_STATUS:
-            device_data = self._api.get_device_data(device_id)
-            data = device_data.get("data")
+        result = self._get_missing_salt(pool_size, current_salinity)
 
-            current_salinity = data.get(RUNTIME_SALINITY_VALUE)
+        return result
 
-            state = self._get_salinity_status(current_salinity)
+    def _decode_salinity_status(self, device_id: int, _state: int) -> str | None:
+        data = self._get_device_state(device_id)
 
-        result = {ATTR_STATE: state}
+        current_salinity = data.get(RUNTIME_SALINITY_VALUE)
+
+        result = self._get_salinity_status(current_salinity)
+
+        return result
+
+    def _decode_api_status(self, _device_id: int, _state: int) -> str:
+        result = self._api.circuit_breaker_state
 
         return result
 
     def _select_state_handler(self, _device_id: int, state: int, _entity_description):
         result = {
             ATTR_STATE: state,
-            ATTR_ACTIONS: {ACTION_ENTITY_SELECT_OPTION: self._handle_select_action},
+            ATTR_ACTIONS: self._platform_actions[Platform.SELECT],
         }
 
         return result
@@ -237,56 +919,43 @@ class Coordinator(DataUpdateCoordinator):
 
         result = {
             ATTR_IS_ON: is_on,
-            ATTR_ACTIONS: {
-                ACTION_ENTITY_TURN_ON: self._handle_turn_on_action,
-                ACTION_ENTITY_TURN_OFF: self._handle_turn_off_action,
-            },
+            ATTR_ACTIONS: self._platform_actions[Platform.SWITCH],
         }
 
         return result
 
-    def _number_state_handler(self, _device_id: int, state: int, entity_description):
-        if entity_description.native_unit_of_measurement == UNIT_PH:
-            state_str = str(state)
-            state_str_fixed = f"{state_str[:1]}.{state_str[1:].ljust(2, '0')}"
-            state = float(state_str_fixed)
+    def _number_state_handler(self, device_id: int, state: int, entity_description):
+        value_decoder = self._value_decoders.get(entity_description.key)
+
+        if value_decoder is not None:
+            state = value_decoder(device_id, state)
 
         result = {
             ATTR_STATE: state,
-            ATTR_ACTIONS: {
-                ACTION_ENTITY_SET_NATIVE_VALUE: self._handle_set_number_action
-            },
+            ATTR_ACTIONS: self._platform_actions[Platform.NUMBER],
         }
 
         return result
 
     def get_data(self, device_id: int, entity_description) -> dict | None:
-        try:
-            device_data = self._api.get_device_data(device_id)
-            data = device_data.get("data")
-
-            state = data.get(entity_description.key)
+        device_states = self._device_states.get(device_id)
 
-            data_retriever = self._data_retrievers.get(
-                entity_description.platform, Platform.SENSOR
-            )
-
-            result = data_retriever(device_id, state, entity_description)
-
-        except Exception as ex:
-            exc_type, exc_obj, tb = sys.exc_info()
-            line_number = tb.tb_lineno
+        result = (
+            None if device_states is None else device_states.get(entity_description.key)
+        )
 
-            _LOGGER.error(
-                f"Failed to extract data for {entity_description}, Error: {ex}, Line: {line_number}"
-            )
+        return result
 
-            result = None
+    def get_device_generation(self, device_id: int) -> int | None:
+        """Changed whenever the entity states of the device were updated."""
+        result = self._device_generations.get(device_id)
 
         return result
 
     def _load_entity_descriptions(self):
         entity_descriptions = {}
+        value_decoders = {}
+        value_encoders = {}
 
         for entity_description in DEFAULT_ENTITY_DESCRIPTIONS:
             if entity_description.platform not in entity_descriptions:
@@ -294,7 +963,41 @@ class Coordinator(DataUpdateCoordinator):
 
             entity_descriptions[entity_description.platform].append(entity_description)
 
+            value_decoder = self._get_value_decoder(entity_description)
+
+            if value_decoder is not None:
+                value_decoders[entity_description.key] = value_decoder
+
+            value_encoder = get_value_encoder(entity_description)
+
+            if value_encoder is not None:
+                value_encoders[entity_description.key] = value_encoder
+
         self._entity_descriptions = entity_descriptions
+        self._value_decoders = value_decoders
+        self._value_encoders = value_encoders
+
+    def _get_value_decoder(
+        self, entity_description: IntegrationEntityDescription
+    ) -> Callable[[int, Any], Any] | None:
+        """Compile decoder of the entity state, once per entity description."""
+        calculated_value_decoders = {
+            SALT_MISSING: self._decode_missing_salt,
+            SALINITY_STATUS: self._decode_salinity_status,
+            API_STATUS: self._decode_api_status,
+        }
+
+        value_decoder = calculated_value_decoders.get(entity_description.key)
+
+        if value_decoder is None:
+            raw_value_decoder = get_value_decoder(entity_description)
+
+            if raw_value_decoder is not None:
+
+                def value_decoder(_device_id: int, state: Any) -> Any:
+                    return raw_value_decoder(state)
+
+        return value_decoder
 
     async def _handle_select_action(
         self,
@@ -304,7 +1007,9 @@ class Coordinator(DataUpdateCoordinator):
     ):
         value = int(option)
 
-        await self._api.set_value(device_id, entity_description.key, value)
+        future = self._api.enqueue_telemetry(device_id, entity_description.key, value)
+
+        self._track_command(future, device_id, entity_description.key, value)
 
     async def _handle_turn_on_action(
         self, device_id: int, entity_description: IntegrationEntityDescription
@@ -325,26 +1030,79 @@ class Coordinator(DataUpdateCoordinator):
         value_int = 1 if value else 0
 
         if entity_description.key in [RUNTIME_DEVICE_ON]:
-            turbo_data = self.get_data(device_id, RUNTIME_DEVICE_TURBO)
-            turbo_time_data = self.get_data(device_id, RUNTIME_DEVICE_TURBO_TIME)
+            data = self._get_device_state(device_id)
 
-            turbo = turbo_data.get(ATTR_STATE)
-            turbo_time = turbo_time_data.get(ATTR_STATE)
+            turbo = data.get(RUNTIME_DEVICE_TURBO)
+            turbo_time = data.get(RUNTIME_DEVICE_TURBO_TIME)
 
             request_data = {"state": value_int, "turbo": turbo, "turboTime": turbo_time}
 
-            await self._api.set_direct_request(device_id, "DeviceAction", request_data)
+            future = self._api.enqueue_direct_request(
+                device_id, "DeviceAction", request_data
+            )
 
         else:
-            await self._api.set_value(device_id, entity_description.key, value_int)
+            future = self._api.enqueue_telemetry(
+                device_id, entity_description.key, value_int
+            )
+
+        self._track_command(future, device_id, entity_description.key, value_int)
 
     async def _handle_set_number_action(
         self,
         device_id: int,
         entity_description: IntegrationEntityDescription,
-        value: int,
+        value: float,
     ):
-        await self._api.set_value(device_id, entity_description.key, value)
+        value_encoder = self._value_encoders.get(entity_description.key)
+
+        # Written and tracked in device units, as reported by the device
+        value = int(value) if value_encoder is None else value_encoder(value)
+
+        future = self._api.enqueue_telemetry(device_id, entity_description.key, value)
+
+        self._track_command(future, device_id, entity_description.key, value)
+
+    def _track_command(self, future: Future, device_id: int, key: str, value: Any):
+        """Apply queued command optimistically, settle it once it was sent."""
+        self._set_pending_write(device_id, key, value)
+
+        future.add_done_callback(partial(self._on_command_done, device_id, key, value))
+
+    @callback
+    def _on_command_done(self, device_id: int, key: str, value: Any, future: Future):
+        success = not future.cancelled() and future.exception() is None
+
+        if success:
+            success = future.result()
+
+        else:
+            _LOGGER.error(
+                f"Failed to execute command, "
+                f"Device: {device_id}, "
+                f"Key: {key}, "
+                f"Error: {None if future.cancelled() else future.exception()}"
+            )
+
+        if success:
+            self.hass.async_create_task(self.async_request_device_refresh(device_id))
+
+        else:
+            pending_write = self._get_pending_write(device_id, key)
+
+            # Newer command of the same key is still pending, keep its value
+            if pending_write is not None and pending_write.get("value") == value:
+                self._pending_writes[device_id].pop(key)
+
+                if len(self._pending_writes[device_id]) == 0:
+                    self._pending_writes.pop(device_id)
+
+                self._write_metrics["rolled_back"] += 1
+
+                changed_keys = self._update_entity_states(device_id)
+                self._async_update_device_listeners(
+                    device_id, changed_keys.union({key})
+                )
 
     @staticmethod
     def _get_missing_salt(pool_size, salinity) -> float:
@@ -0,0 +1,153 @@
+from asyncio import FIRST_COMPLETED, CancelledError, create_task, gather, wait
+from collections import deque
+import logging
+from math import ceil
+from time import monotonic
+from typing import Any, Awaitable, Callable
+
+from ..common.consts import (
+    API_HEDGE_MAX_RATIO,
+    API_HEDGE_MIN_SAMPLES,
+    API_HEDGE_PERCENTILE,
+    API_LATENCY_SAMPLES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class HedgingPolicy:
+    """Send a duplicate of a slow idempotent request, first response wins.
+
+    Request is hedged once it took longer than the percentile of the recent
+    latencies, hedged requests are limited to a ratio of the recent requests.
+    """
+
+    _percentile: float
+    _min_samples: int
+    _max_ratio: float
+    _latencies: deque[float]
+    _hedged: deque[bool]
+    _metrics: dict
+
+    def __init__(
+        self,
+        percentile: float = API_HEDGE_PERCENTILE,
+        min_samples: int = API_HEDGE_MIN_SAMPLES,
+        max_ratio: float = API_HEDGE_MAX_RATIO,
+        samples: int = API_LATENCY_SAMPLES,
+    ):
+        self._percentile = percentile
+        self._min_samples = min_samples
+        self._max_ratio = max_ratio
+
+        self._latencies = deque(maxlen=samples)
+        self._hedged = deque(maxlen=samples)
+
+        self._metrics = {"requests": 0, "hedged": 0, "hedge_wins": 0}
+
+    @property
+    def metrics(self) -> dict:
+        result = {
+            **self._metrics,
+            "hedge_delay": self.get_hedge_delay(),
+        }
+
+        return result
+
+    def get_hedge_delay(self) -> float | None:
+        """Latency percentile of recent requests, None while not enough samples."""
+        result = None
+
+        if len(self._latencies) >= self._min_samples:
+            latencies = sorted(self._latencies)
+            index = ceil(len(latencies) * self._percentile) - 1
+
+            result = round(latencies[index], 3)
+
+        return result
+
+    async def execute(
+        self,
+        action: Callable[[], Awaitable[Any]],
+        hedge_action: Callable[[], Awaitable[Any]] | None = None,
+        is_hedge_allowed: Callable[[], bool] | None = None,
+    ) -> Any:
+        """Execute the action, once slow execute the hedge action (same by default).
+
+        Action is expected to send the request right away, its latency is measured
+        from the start. Hedge is sent only when allowed by is_hedge_allowed as well.
+        """
+        self._metrics["requests"] += 1
+
+        hedge_delay = self.get_hedge_delay()
+
+        tasks = {create_task(action()): monotonic()}
+
+        try:
+            if hedge_delay is not None:
+                done, _ = await wait(tasks.keys(), timeout=hedge_delay)
+
+                if len(done) == 0 and self._can_hedge(is_hedge_allowed):
+                    _LOGGER.debug(
+                        f"Request exceeded {hedge_delay:.3f}s, sending hedged request"
+                    )
+
+                    hedge = action if hedge_action is None else hedge_action
+
+                    tasks[create_task(hedge())] = monotonic()
+
+            self._hedged.append(len(tasks) > 1)
+
+            result = await self._get_first_result(tasks)
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            await gather(*tasks, return_exceptions=True)
+
+        return result
+
+    async def _get_first_result(self, tasks: dict) -> Any:
+        """Result of the first successful request, error of the first otherwise."""
+        first_task = list(tasks.keys())[0]
+        pending = tasks.keys()
+        error = None
+
+        while len(pending) > 0:
+            done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+
+            for task in done:
+                try:
+                    result = task.result()
+
+                except CancelledError as cex:
+                    raise cex
+
+                except Exception as ex:
+                    error = ex if error is None else error
+
+                    continue
+
+                # Measured from the first send, a winning hedge keeps the slow tail
+                self._latencies.append(monotonic() - tasks[first_task])
+
+                if task != first_task:
+                    self._metrics["hedge_wins"] += 1
+
+                return result
+
+        raise error
+
+    def _can_hedge(self, is_hedge_allowed: Callable[[], bool] | None) -> bool:
+        hedged = sum(1 for is_hedged in self._hedged if is_hedged)
+        result = hedged < ceil(len(self._hedged) * self._max_ratio)
+
+        # Checked last, it may reserve resources for the hedged request
+        if result and is_hedge_allowed is not None:
+            result = is_hedge_allowed()
+
+        if result:
+            self._metrics["hedged"] += 1
+
+        return result
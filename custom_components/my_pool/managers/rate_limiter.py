@@ -0,0 +1,189 @@
+from asyncio import Lock, sleep
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import logging
+from time import monotonic
+
+from aiohttp import ClientResponseError
+
+from ..common.consts import API_RATE_LIMITS, RATE_LIMIT_DEFAULT_PAUSE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Allow requests at a steady rate with bursts up to the bucket capacity."""
+
+    _name: str
+    _rate: float
+    _capacity: float
+    _tokens: float
+    _updated_at: float
+    _paused_until: float | None
+    _lock: Lock
+    _metrics: dict
+
+    def __init__(self, name: str, rate: float, capacity: float):
+        self._name = name
+        self._rate = rate
+        self._capacity = capacity
+
+        self._tokens = capacity
+        self._updated_at = monotonic()
+        self._paused_until = None
+        self._lock = Lock()
+
+        self._metrics = {"throttle_events": 0, "delayed_requests": 0, "wait_time": 0}
+
+    @property
+    def metrics(self) -> dict:
+        self._refill()
+
+        paused_for = None
+
+        if self._paused_until is not None:
+            paused_for = round(max(self._paused_until - monotonic(), 0), 3)
+
+        result = {
+            **self._metrics,
+            "tokens": round(self._tokens, 3),
+            "paused_for": paused_for,
+        }
+
+        return result
+
+    async def acquire(self):
+        """Wait for a token, requests are served in order of arrival."""
+        async with self._lock:
+            started_at = monotonic()
+            is_delayed = False
+
+            while True:
+                self._refill()
+
+                now = monotonic()
+
+                if self._paused_until is not None and now < self._paused_until:
+                    delay = self._paused_until - now
+
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+
+                    break
+
+                else:
+                    delay = (1 - self._tokens) / self._rate
+
+                is_delayed = True
+
+                await sleep(delay)
+
+            if is_delayed:
+                wait_time = monotonic() - started_at
+
+                self._metrics["delayed_requests"] += 1
+                self._metrics["wait_time"] = round(
+                    self._metrics["wait_time"] + wait_time, 3
+                )
+
+    def try_acquire(self) -> bool:
+        """Take a token without waiting, False while throttled or others wait."""
+        result = False
+
+        if not self._lock.locked():
+            self._refill()
+
+            if self._paused_until is None and self._tokens >= 1:
+                self._tokens -= 1
+
+                result = True
+
+        return result
+
+    def pause(self, seconds: float):
+        """Stop serving requests, e.g. when the API responded with 429."""
+        paused_until = monotonic() + seconds
+
+        if self._paused_until is None or self._paused_until < paused_until:
+            self._paused_until = paused_until
+
+        self._tokens = 0
+        self._metrics["throttle_events"] += 1
+
+        _LOGGER.warning(
+            f"Requests are throttled by the API, "
+            f"Bucket: {self._name}, "
+            f"Paused for: {seconds:.0f}s"
+        )
+
+    def _refill(self):
+        now = monotonic()
+
+        if self._paused_until is not None and now >= self._paused_until:
+            self._paused_until = None
+
+        if self._paused_until is None:
+            elapsed = now - self._updated_at
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+
+        self._updated_at = now
+
+
+class RateLimiter:
+    """Token buckets by request type (read / write) for requests to the API."""
+
+    _buckets: dict[str, TokenBucket]
+
+    def __init__(self):
+        self._buckets = {
+            bucket_name: TokenBucket(bucket_name, rate, capacity)
+            for bucket_name, (rate, capacity) in API_RATE_LIMITS.items()
+        }
+
+    @property
+    def metrics(self) -> dict:
+        result = {
+            bucket_name: self._buckets[bucket_name].metrics
+            for bucket_name in self._buckets
+        }
+
+        return result
+
+    async def acquire(self, bucket_name: str):
+        await self._buckets[bucket_name].acquire()
+
+    def try_acquire(self, bucket_name: str) -> bool:
+        result = self._buckets[bucket_name].try_acquire()
+
+        return result
+
+    def throttle(self, bucket_name: str, ex: ClientResponseError):
+        retry_after = self.get_retry_after(ex)
+
+        self._buckets[bucket_name].pause(retry_after)
+
+    @staticmethod
+    def get_retry_after(ex: ClientResponseError) -> float:
+        """Parse Retry-After header, either delay in seconds or HTTP date."""
+        headers = ex.headers
+        retry_after = None if headers is None else headers.get("Retry-After")
+
+        result = RATE_LIMIT_DEFAULT_PAUSE.total_seconds()
+
+        if retry_after is not None:
+            try:
+                result = float(retry_after)
+
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    now = datetime.now(timezone.utc)
+
+                    result = (retry_at - now).total_seconds()
+
+                except (TypeError, ValueError):
+                    _LOGGER.debug(f"Invalid Retry-After header: {retry_after}")
+
+        result = max(result, 0)
+
+        return result
@@ -1,53 +1,173 @@
 """Platform for climate integration."""
-from asyncio import sleep
-from copy import copy
+from asyncio import (
+    CancelledError,
+    Future,
+    Lock,
+    Semaphore,
+    Task,
+    TimerHandle,
+    create_task,
+    gather,
+    get_running_loop,
+    shield,
+    sleep,
+    wait,
+    wait_for,
+)
+import base64
+from collections import deque
 import json
 import logging
 import sys
+from time import monotonic, time
+from types import MappingProxyType
+from typing import Awaitable, Callable, Mapping
 
-from aiohttp import ClientResponseError, ClientSession
+from aiohttp import ClientResponseError, ClientSession, ClientTimeout
 
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
-from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from ..common.consts import (
+    API_CONNECT_TIMEOUT,
+    API_ENDPOINT_TIMEOUTS,
+    API_HEDGED_ENDPOINTS,
     API_MAX_ATTEMPTS,
+    API_MAX_CONCURRENT_REQUESTS,
+    API_READ_TIMEOUT,
+    COMMAND_PRIORITY_HIGH,
+    COMMAND_PRIORITY_LOW,
     CONF_FCM_TOKEN,
-    SIGNAL_DEVICE_NEW,
+    METRICS_SAMPLES,
+    RATE_LIMIT_READ,
+    RATE_LIMIT_WRITE,
+    TELEMETRY_BATCH_WINDOW,
+    TOKEN_EXPIRY_MARGIN,
+    TOKEN_REFRESH_INTERVAL,
+    TOKEN_REFRESH_MARGIN,
+    TOKEN_REFRESH_MIN_DELAY,
+    TOKEN_REFRESH_RETRY_DELAY,
+    TOKEN_VALIDATION_TTL,
+    UPDATE_API_DEADLINE,
+    UPDATE_API_MIN_INTERVAL,
+    UPDATE_INVENTORY,
     UPDATE_TELEMETRY_PARAMS,
 )
 from ..common.endpoints import Endpoints
-from ..common.exceptions import InvalidTokenError, LoginError, OperationFailedException
+from ..common.exceptions import (
+    CircuitOpenError,
+    InvalidTokenError,
+    LoginError,
+    OperationFailedException,
+)
+from .circuit_breaker import CircuitBreaker
 from .config_manager import ConfigManager
+from .hedging_policy import HedgingPolicy
+from .rate_limiter import RateLimiter
+from .retry_policy import RetryPolicy
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class RestAPI:
-    _devices: dict
+    _devices: dict[int, Mapping]
     _member_details: dict | None
 
     _session: ClientSession | None
     _config_manager: ConfigManager
     _hass: HomeAssistant | None
-    _dispatched_devices: list[int]
+    _update_lock: Lock
+    _update_listeners: list[Callable[[list[int]], None]]
+    _device_updated_at: dict[int, float]
+    _requests_semaphore: Semaphore
+    _update_metrics: dict
+    _token_valid_until: float | None
+    _inventory_updated_at: float | None
+    _retry_policy: RetryPolicy
+    _circuit_breaker: CircuitBreaker
+    _rate_limiter: RateLimiter
+    _hedging_policy: HedgingPolicy
+    _reauthentication_task: Task | None
+    _token_refresh_handle: TimerHandle | None
+    _token_refresh_task: Task | None
+    _token_refresh_scheduled_for: str | None
+    _default_timeout: ClientTimeout
+    _endpoint_timeouts: dict[str, ClientTimeout]
+    _command_queues: dict[int, dict[str, dict]]
+    _command_workers: dict[int, Task]
+    _command_metrics: dict
+    _command_wait_times: deque[float]
 
     _api_status: bool
 
-    def __init__(self, hass: HomeAssistant | None, config_manager: ConfigManager):
+    def __init__(
+        self,
+        hass: HomeAssistant | None,
+        config_manager: ConfigManager,
+        session: ClientSession | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ):
         """Initialize the climate entity."""
 
         self._devices = {}
         self._member_details = None
 
-        self._session = None
+        self._session = session
 
         self._hass = hass
         self._config_manager = config_manager
 
-        self._dispatched_devices = []
+        self._update_lock = Lock()
+        self._update_listeners = []
+        self._device_updated_at = {}
+
+        self._requests_semaphore = Semaphore(API_MAX_CONCURRENT_REQUESTS)
+        self._update_metrics = {}
+
+        self._token_valid_until = None
+        self._inventory_updated_at = None
+
+        self._retry_policy = RetryPolicy()
+        self._circuit_breaker = CircuitBreaker(Endpoints.BaseURL)
+        self._rate_limiter = RateLimiter() if rate_limiter is None else rate_limiter
+        self._hedging_policy = HedgingPolicy()
+
+        self._reauthentication_task = None
+        self._token_refresh_handle = None
+        self._token_refresh_task = None
+        self._token_refresh_scheduled_for = None
+
+        self._default_timeout = ClientTimeout(
+            connect=API_CONNECT_TIMEOUT, sock_read=API_READ_TIMEOUT
+        )
+        self._endpoint_timeouts = {
+            endpoint: ClientTimeout(connect=connect_timeout, sock_read=read_timeout)
+            for endpoint, (
+                connect_timeout,
+                read_timeout,
+            ) in API_ENDPOINT_TIMEOUTS.items()
+        }
+
+        self._command_queues = {}
+        self._command_workers = {}
+        self._command_metrics = {"executed": 0, "replaced": 0, "max_queue_depth": 0}
+        self._command_wait_times = deque(maxlen=METRICS_SAMPLES)
+
+    @property
+    def config_manager(self) -> ConfigManager:
+        result = self._config_manager
+
+        return result
+
+    async def set_config_manager(self, config_manager: ConfigManager):
+        """Keep the token of the account in another entry's config manager."""
+        token = self._config_manager.token
+
+        if config_manager.token != token:
+            await config_manager.update_token_key(token)
+
+        self._config_manager = config_manager
 
     @property
     def member_details(self):
@@ -61,6 +181,30 @@ class RestAPI:
 
         return result
 
+    @property
+    def update_metrics(self) -> dict:
+        result = self._update_metrics
+
+        return result
+
+    @property
+    def hedging_metrics(self) -> dict:
+        result = self._hedging_policy.metrics
+
+        return result
+
+    @property
+    def rate_limit_metrics(self) -> dict:
+        result = self._rate_limiter.metrics
+
+        return result
+
+    @property
+    def circuit_breaker_state(self) -> str:
+        result = self._circuit_breaker.state
+
+        return result
+
     async def initialize(self, throw_error: bool = False):
         try:
             if self._session is None:
@@ -69,7 +213,7 @@ class RestAPI:
                 else:
                     self._session = async_create_clientsession(hass=self._hass)
 
-                await self._connect()
+            await self._connect()
 
         except LoginError as lex:
             if throw_error:
@@ -89,31 +233,335 @@ class RestAPI:
             )
 
     async def terminate(self):
+        self._cancel_token_refresh()
+
+        if self._token_refresh_task is not None:
+            self._token_refresh_task.cancel()
+
+        command_workers = list(self._command_workers.values())
+
+        for command_worker in command_workers:
+            command_worker.cancel()
+
+        await gather(*command_workers, return_exceptions=True)
+
+        self._cancel_queued_commands()
+
         if self._hass is None:
             await self._session.close()
 
-    async def update(self):
-        """Fetch new state parameters for the sensor."""
-        await self._internal_update()
+    async def update(
+        self,
+        device_filter: Callable[[int], bool] | None = None,
+        requester: Callable[[list[int]], None] | None = None,
+    ) -> list[int]:
+        """Fetch new state parameters for the sensor.
+
+        Only devices matching the filter (all when not set) are fetched,
+        devices fetched recently (e.g. by another entry of the account) are skipped.
+        Returns the devices that were fetched, listeners other than the requester
+        are notified with them.
+        """
+        async with self._update_lock:
+            device_ids = await self._internal_update(
+                lambda device_id: not self._is_device_fresh(device_id)
+                and (device_filter is None or device_filter(device_id))
+            )
+
+        self._notify_update_listeners(device_ids, requester)
+
+        return device_ids
+
+    async def update_device(
+        self, device_id: int, requester: Callable[[list[int]], None] | None = None
+    ):
+        """Fetch state of a single device."""
+        if device_id not in self._devices:
+            return
+
+        try:
+            await self._connect()
+
+            await self._update_device(device_id)
+
+            self._publish_device(device_id, stale=False)
+
+            self._notify_update_listeners([device_id], requester)
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(
+                f"Failed to update device: {device_id}, "
+                f"Error: {ex}, "
+                f"Line: {line_number}"
+            )
+
+    def add_update_listener(
+        self, update_callback: Callable[[list[int]], None]
+    ) -> Callable[[], None]:
+        """Listen for devices fetched by any entry of the account."""
+        self._update_listeners.append(update_callback)
+
+        def remove_listener() -> None:
+            self._update_listeners.remove(update_callback)
+
+        return remove_listener
+
+    def _notify_update_listeners(
+        self,
+        device_ids: list[int],
+        requester: Callable[[list[int]], None] | None,
+    ):
+        if len(device_ids) == 0:
+            return
+
+        for update_callback in list(self._update_listeners):
+            if update_callback != requester:
+                update_callback(device_ids)
+
+    def _is_device_fresh(self, device_id: int) -> bool:
+        updated_at = self._device_updated_at.get(device_id)
+
+        is_fresh = (
+            updated_at is not None
+            and monotonic() - updated_at < UPDATE_API_MIN_INTERVAL.total_seconds()
+        )
+
+        return is_fresh
+
+    @property
+    def _is_token_valid(self) -> bool:
+        is_valid = (
+            self._config_manager.token is not None
+            and self._token_valid_until is not None
+            and time() < self._token_valid_until
+        )
+
+        return is_valid
+
+    @property
+    def _is_inventory_expired(self) -> bool:
+        is_expired = (
+            self._inventory_updated_at is None
+            or monotonic() - self._inventory_updated_at
+            >= UPDATE_INVENTORY.total_seconds()
+        )
+
+        return is_expired
 
     async def _connect(self):
-        await self._validate_token()
+        # Token check response holds the devices list, inventory is refreshed with it
+        if not self._is_token_valid or self._is_inventory_expired:
+            await self._validate_token()
 
         if self._config_manager.token is None:
-            await self._login()
+            await self._reauthenticate(None)
 
     async def _validate_token(self):
         try:
             token = self._config_manager.token
 
             if token is not None:
-                validation_response = await self._get_request(Endpoints.CheckToken)
+                validation_response = await self._retry_policy.execute(
+                    lambda: self._get_request(Endpoints.CheckToken), "check token"
+                )
 
                 await self._handle_auth(validation_response, token)
 
+        except ClientResponseError as cre:
+            if cre.status in [401, 403]:
+                await self._invalidate_token()
+
+            _LOGGER.error(f"Failed to check token, Error: {cre}")
+
         except Exception as ex:
             _LOGGER.error(f"Failed to check token, Error: {ex}")
 
+    async def _invalidate_token(self):
+        self._token_valid_until = None
+
+        self._cancel_token_refresh()
+
+        await self._config_manager.update_token_key(None)
+
+    def _set_token_validity(self, token: str | None):
+        """Cache token validity until TTL or token's expiry, whichever is first."""
+        if token is None:
+            self._token_valid_until = None
+
+        else:
+            now = time()
+            valid_until = now + TOKEN_VALIDATION_TTL.total_seconds()
+
+            expiry = self._get_token_expiry(token)
+
+            if expiry is not None:
+                valid_until = min(
+                    valid_until, expiry - TOKEN_EXPIRY_MARGIN.total_seconds()
+                )
+
+            self._token_valid_until = valid_until
+
+            _LOGGER.debug(f"Token is valid for {valid_until - now:.0f} seconds")
+
+            self._schedule_token_refresh(token)
+
+    def _schedule_token_refresh(self, token: str, delay: float | None = None):
+        """Refresh the token in the background before it expires."""
+        if token == self._token_refresh_scheduled_for:
+            return
+
+        self._cancel_token_refresh()
+
+        now = time()
+        expiry = self._get_token_expiry(token)
+
+        if delay is None:
+            if expiry is None:
+                refresh_at = now + TOKEN_REFRESH_INTERVAL.total_seconds()
+
+            else:
+                refresh_at = expiry - TOKEN_REFRESH_MARGIN.total_seconds()
+
+            delay = max(refresh_at - now, TOKEN_REFRESH_MIN_DELAY.total_seconds())
+
+        loop = get_running_loop()
+
+        self._token_refresh_handle = loop.call_later(
+            delay, self._on_token_refresh_due, token, expiry
+        )
+        self._token_refresh_scheduled_for = token
+
+        _LOGGER.debug(f"Token refresh scheduled in {delay:.0f} seconds")
+
+    def _cancel_token_refresh(self):
+        if self._token_refresh_handle is not None:
+            self._token_refresh_handle.cancel()
+
+        self._token_refresh_handle = None
+        self._token_refresh_scheduled_for = None
+
+    def _on_token_refresh_due(self, token: str, expiry: float | None):
+        self._token_refresh_handle = None
+        self._token_refresh_scheduled_for = None
+
+        self._token_refresh_task = self._create_task(self._refresh_token(token, expiry))
+
+    async def _refresh_token(self, token: str, expiry: float | None):
+        started_at = monotonic()
+        time_to_expiry = "N/A" if expiry is None else f"{expiry - time():.0f}s"
+
+        try:
+            await self._reauthenticate(token)
+
+            if self._config_manager.token == token:
+                # Login failed without rejecting the token, it is kept until expired
+                if self._is_token_valid:
+                    self._schedule_token_refresh(
+                        token, TOKEN_REFRESH_RETRY_DELAY.total_seconds()
+                    )
+
+                _LOGGER.warning(
+                    f"Failed to refresh token in background, "
+                    f"Duration: {monotonic() - started_at:.3f}s, "
+                    f"Time to expiry: {time_to_expiry}"
+                )
+
+            else:
+                _LOGGER.debug(
+                    f"Token refreshed in background, "
+                    f"Duration: {monotonic() - started_at:.3f}s, "
+                    f"Time to expiry: {time_to_expiry}"
+                )
+
+        except Exception as ex:
+            _LOGGER.warning(
+                f"Failed to refresh token in background, "
+                f"Duration: {monotonic() - started_at:.3f}s, "
+                f"Time to expiry: {time_to_expiry}, "
+                f"Error: {ex}"
+            )
+
+        finally:
+            self._token_refresh_task = None
+
+    @staticmethod
+    def _get_token_expiry(token: str) -> float | None:
+        try:
+            token_parts = token.split(".")
+            payload = token_parts[1]
+            payload_padded = payload + "=" * (-len(payload) % 4)
+
+            claims = json.loads(base64.urlsafe_b64decode(payload_padded))
+            expiry = claims.get("exp")
+
+            result = None if expiry is None else float(expiry)
+
+        except Exception as ex:
+            _LOGGER.debug(f"Unable to extract token expiry, Error: {ex}")
+
+            result = None
+
+        return result
+
+    async def _reauthenticate(self, failed_token: str | None):
+        """Single-flight login, concurrent callers wait for the same login."""
+        if self._config_manager.token != failed_token:
+            _LOGGER.debug("Token was already renewed")
+
+            return
+
+        if self._reauthentication_task is None:
+            task = self._create_task(self._login())
+            task.add_done_callback(self._on_reauthentication_done)
+
+            self._reauthentication_task = task
+
+        # Shielded so a cancelled caller will not cancel the login of others
+        await shield(self._reauthentication_task)
+
+    def _on_reauthentication_done(self, _task: Task):
+        self._reauthentication_task = None
+
+    def _create_task(self, target: Awaitable) -> Task:
+        if self._hass is None:
+            task = create_task(target)
+
+        else:
+            task = self._hass.async_create_task(target)
+
+        return task
+
+    async def _execute_authenticated_request(
+        self, action: Callable[[], Awaitable[dict | None]], description: str
+    ) -> dict | None:
+        """Execute request, on 401/403 re-authenticate once and replay it."""
+        token = self._config_manager.token
+
+        try:
+            result = await action()
+
+        except ClientResponseError as cre:
+            if cre.status not in [401, 403]:
+                raise cre
+
+            _LOGGER.debug(f"Token rejected, re-authenticating to {description}")
+
+            await self._reauthenticate(token)
+
+            try:
+                result = await action()
+
+            except ClientResponseError as replay_cre:
+                if replay_cre.status in [401, 403]:
+                    raise InvalidTokenError(description)
+
+                raise replay_cre
+
+        return result
+
     async def _login(self):
         request_data = {
             CONF_EMAIL: self._config_manager.username,
@@ -122,22 +570,26 @@ class RestAPI:
         }
 
         try:
-            login_response = await self._post_request(Endpoints.Login, request_data)
+            login_response = await self._retry_policy.execute(
+                lambda: self._post_request(Endpoints.Login, request_data), "login"
+            )
 
             await self._handle_auth(login_response)
 
-        except Exception as ex:
-            await self._config_manager.update_token_key(None)
+        except ClientResponseError as cre:
+            if cre.status in [401, 403]:
+                await self._invalidate_token()
+
+            _LOGGER.error(f"Failed to login, Error: {cre}")
 
+        except Exception as ex:
+            # Current token (if any) is kept, it may still be valid
             _LOGGER.error(f"Failed to login, Error: {ex}")
 
         if self._config_manager.token is None:
             raise LoginError()
 
     async def _handle_auth(self, response: dict, token: str | None = None):
-        member_details = None
-        devices = []
-
         success = response.get("success", False)
         message = response.get("message", "Check token")
 
@@ -150,93 +602,209 @@ class RestAPI:
             shared_devices: list = data.get("devices")
             devices.extend(shared_devices)
 
-            member_details = data.get("member")
+            self._member_details = data.get("member")
+
+            self._reconcile_devices(devices)
 
             if token is None:
                 token = response.get("token")
 
-        self._member_details = member_details
-        self._devices = {
-            device.get("id"): {"metadata": device, "data": None} for device in devices
-        }
+            self._set_token_validity(token)
+
+        else:
+            self._set_token_validity(None)
 
         await self._config_manager.update_token_key(token)
 
-    async def _internal_update(self, attempt: int = 1):
+    def _reconcile_devices(self, devices: list[dict]):
+        """Apply inventory changes, state of existing devices is kept."""
+        device_ids = []
+        added_device_ids = []
+
+        for device in devices:
+            device_id = device.get("id")
+            device_ids.append(device_id)
+
+            device_data = self._devices.get(device_id)
+
+            if device_data is None:
+                added_device_ids.append(device_id)
+
+            if device_data is None or device_data.get("metadata") != device:
+                self._publish_device(device_id, metadata=device)
+
+        removed_device_ids = [
+            device_id for device_id in self._devices if device_id not in device_ids
+        ]
+
+        for device_id in removed_device_ids:
+            self._devices.pop(device_id)
+            self._device_updated_at.pop(device_id, None)
+
+        self._inventory_updated_at = monotonic()
+
+        if len(added_device_ids) > 0 or len(removed_device_ids) > 0:
+            _LOGGER.info(
+                f"Devices inventory changed, "
+                f"Added: {added_device_ids}, "
+                f"Removed: {removed_device_ids}"
+            )
+
+    async def _internal_update(
+        self, device_filter: Callable[[int], bool] | None
+    ) -> list[int]:
         """Fetch new state parameters for the sensor."""
-        error = None
-        line_number = None
+        device_ids = []
+
+        self._retry_policy.reset_budget()
+
+        if not self._circuit_breaker.is_available:
+            _LOGGER.debug("API is unavailable, skipping update")
+
+            return device_ids
+
+        deadline = monotonic() + UPDATE_API_DEADLINE.total_seconds()
 
         try:
-            await self._connect()
+            # Token check and login are part of the cycle, bound by the deadline
+            await wait_for(self._connect(), max(deadline - monotonic(), 0))
 
-            for device_id in self._devices:
-                await self._update_device(device_id)
+            device_ids = [
+                device_id
+                for device_id in self._devices
+                if device_filter is None or device_filter(device_id)
+            ]
 
-        except LoginError as lex:
-            exc_type, exc_obj, tb = sys.exc_info()
-            line_number = tb.tb_lineno
+            errors = await self._update_devices(device_ids, deadline)
 
-            await self._config_manager.update_token_key(None)
+            for device_id in errors:
+                device_error = errors[device_id]
+                log_message = (
+                    f"Failed to update device: {device_id}, Error: {device_error}"
+                )
 
-            error = lex
+                if isinstance(device_error, CircuitOpenError):
+                    _LOGGER.debug(log_message)
 
-        except InvalidTokenError as itex:
-            exc_type, exc_obj, tb = sys.exc_info()
-            line_number = tb.tb_lineno
+                else:
+                    _LOGGER.error(log_message)
 
-            await self._config_manager.update_token_key(None)
+        except LoginError as lex:
+            await self._invalidate_token()
+
+            _LOGGER.error(f"Failed to update, Error: {lex}")
 
-            error = itex
+        except TimeoutError:
+            _LOGGER.warning(
+                f"Failed to connect within the update deadline, "
+                f"Deadline: {UPDATE_API_DEADLINE.total_seconds():.0f}s"
+            )
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
             line_number = tb.tb_lineno
 
-            error = ex
+            _LOGGER.error(f"Failed to update, Error: {ex}, Line: {line_number}")
 
-        if error is not None:
-            if attempt < API_MAX_ATTEMPTS:
-                _LOGGER.debug(
-                    f"Failed to update (Attempt #{attempt}), trying again, "
-                    f"Error: {error}, "
-                    f"Line: {line_number}"
-                )
+        return device_ids
 
-                await sleep(1)
+    async def _update_devices(
+        self, device_ids: list[int], deadline: float
+    ) -> dict[int, Exception]:
+        """Fetch all devices concurrently, errors are collected per device.
 
-                await self._internal_update(attempt + 1)
+        Devices not fetched by the deadline keep their last data and are marked stale.
+        """
+        started_at = monotonic()
+        latencies = []
+        errors = {}
+        timed_out_device_ids = []
 
-            else:
-                _LOGGER.error(
-                    f"Failed to update (Attempt #{attempt}), Error: {error}, Line: {line_number}"
+        tasks = {
+            device_id: create_task(self._update_device_with_limit(device_id, latencies))
+            for device_id in device_ids
+        }
+
+        if len(tasks) > 0:
+            try:
+                _, pending = await wait(
+                    tasks.values(), timeout=max(deadline - started_at, 0)
                 )
 
-    async def _update_device(self, device_id: int):
-        _LOGGER.debug(f"Starting to update device: {device_id}")
+            except CancelledError as cex:
+                for task in tasks.values():
+                    task.cancel()
 
-        try:
-            new_device = device_id not in self._dispatched_devices
+                raise cex
 
-            await self._fetch_data(device_id)
+            for task in pending:
+                task.cancel()
 
-            if new_device:
-                self._dispatched_devices.append(device_id)
+            await gather(*pending, return_exceptions=True)
 
-                if self._hass is not None:
-                    async_dispatcher_send(
-                        self._hass,
-                        SIGNAL_DEVICE_NEW,
-                        self._config_manager.entry_id,
-                        device_id,
-                    )
+            for device_id in tasks:
+                task = tasks[device_id]
 
-        except ClientResponseError as cre:
-            if cre.status in [401, 403]:
-                raise InvalidTokenError(f"Update device: {device_id}")
+                if task in pending:
+                    timed_out_device_ids.append(device_id)
 
-            else:
-                raise cre
+                elif task.exception() is not None:
+                    errors[device_id] = task.exception()
+
+        for device_id in device_ids:
+            is_stale = device_id in errors or device_id in timed_out_device_ids
+
+            if device_id in self._devices:
+                self._publish_device(device_id, stale=is_stale)
+
+        if len(timed_out_device_ids) > 0:
+            _LOGGER.warning(
+                f"Update deadline reached, " f"Stale devices: {timed_out_device_ids}"
+            )
+
+        wall_time = monotonic() - started_at
+        requests_time = sum(latencies)
+
+        self._update_metrics = {
+            "devices": len(device_ids),
+            "failed": len(errors),
+            "stale": len(errors) + len(timed_out_device_ids),
+            "wall_time": round(wall_time, 3),
+            "requests_time": round(requests_time, 3),
+        }
+
+        _LOGGER.debug(
+            f"Devices updated, "
+            f"Devices: {len(device_ids)}, "
+            f"Failed: {len(errors)}, "
+            f"Timed out: {len(timed_out_device_ids)}, "
+            f"Wall time: {wall_time:.3f}s, "
+            f"Requests time: {requests_time:.3f}s"
+        )
+
+        return errors
+
+    async def _update_device_with_limit(self, device_id: int, latencies: list[float]):
+        async with self._requests_semaphore:
+            started_at = monotonic()
+
+            try:
+                await self._update_device(device_id)
+
+            finally:
+                latencies.append(monotonic() - started_at)
+
+    async def _update_device(self, device_id: int):
+        _LOGGER.debug(f"Starting to update device: {device_id}")
+
+        description = f"update device: {device_id}"
+
+        await self._execute_authenticated_request(
+            lambda: self._retry_policy.execute(
+                lambda: self._fetch_data(device_id), description
+            ),
+            description,
+        )
 
     async def _perform_action(
         self, request_data: dict, operation: str, attempt: int = 1
@@ -249,10 +817,8 @@ class RestAPI:
 
         except ClientResponseError as cre:
             if cre.status in [401, 403]:
-                await self._config_manager.update_token_key(None)
-
                 if attempt < API_MAX_ATTEMPTS:
-                    await self._connect()
+                    await self._reauthenticate(self._config_manager.token)
 
                     await self._perform_action(request_data, operation, attempt + 1)
 
@@ -268,13 +834,18 @@ class RestAPI:
         response = await self._get_request(Endpoints.DeviceStatus, request_data)
         success = response.get("success", False)
 
+        if device_id not in self._devices:
+            # Device was removed from the inventory while fetching its state
+            return
+
         if success:
             data = response.get("data")
 
-            self._devices[device_id]["data"] = data
+            self._publish_device(device_id, data=data)
+            self._device_updated_at[device_id] = monotonic()
 
         else:
-            self._devices[device_id]["data"] = None
+            self._publish_device(device_id, data=None)
 
     async def _post_request(
         self, endpoint: Endpoints, data: dict | list | None = None
@@ -287,8 +858,24 @@ class RestAPI:
                 "Authorization": f"Bearer {self._config_manager.token}",
             }
 
+        timeout = self._get_timeout(endpoint)
+
+        result = await self._execute_request(
+            RATE_LIMIT_WRITE,
+            lambda: self._send_post_request(url, headers, data, timeout),
+        )
+
+        return result
+
+    async def _send_post_request(
+        self,
+        url: str,
+        headers: dict | None,
+        data: dict | list | None,
+        timeout: ClientTimeout,
+    ) -> dict | None:
         async with self._session.post(
-            url, headers=headers, json=data, ssl=False
+            url, headers=headers, json=data, ssl=False, timeout=timeout
         ) as response:
             response.raise_for_status()
 
@@ -315,59 +902,372 @@ class RestAPI:
             "Authorization": f"Bearer {self._config_manager.token}",
         }
 
-        async with self._session.get(url, headers=headers, ssl=False) as response:
+        timeout = self._get_timeout(endpoint)
+
+        def send_request() -> Awaitable[dict | None]:
+            return self._send_request(
+                RATE_LIMIT_READ,
+                lambda: self._send_get_request(url, headers, timeout),
+            )
+
+        # Acquired before hedging, latency is measured once the request is sent
+        await self._rate_limiter.acquire(RATE_LIMIT_READ)
+
+        if endpoint in API_HEDGED_ENDPOINTS:
+            result = await self._hedging_policy.execute(
+                send_request,
+                lambda: self._send_hedged_request(send_request),
+                self._is_hedge_allowed,
+            )
+
+        else:
+            result = await send_request()
+
+        return result
+
+    def _is_hedge_allowed(self) -> bool:
+        """Hedge only with a free request slot and a read token, without waiting."""
+        result = not self._requests_semaphore.locked() and (
+            self._rate_limiter.try_acquire(RATE_LIMIT_READ)
+        )
+
+        return result
+
+    async def _send_hedged_request(
+        self, send_request: Callable[[], Awaitable[dict | None]]
+    ) -> dict | None:
+        async with self._requests_semaphore:
+            result = await send_request()
+
+        return result
+
+    async def _execute_request(
+        self, bucket_name: str, action: Callable[[], Awaitable[dict | None]]
+    ) -> dict | None:
+        await self._rate_limiter.acquire(bucket_name)
+
+        result = await self._send_request(bucket_name, action)
+
+        return result
+
+    async def _send_request(
+        self, bucket_name: str, action: Callable[[], Awaitable[dict | None]]
+    ) -> dict | None:
+        """Send request through the circuit breaker, token is already acquired."""
+        try:
+            result = await self._circuit_breaker.execute(action)
+
+        except ClientResponseError as crex:
+            if crex.status == 429:
+                self._rate_limiter.throttle(bucket_name, crex)
+
+            raise crex
+
+        return result
+
+    async def _send_get_request(
+        self, url: str, headers: dict, timeout: ClientTimeout
+    ) -> dict | None:
+        async with self._session.get(
+            url, headers=headers, ssl=False, timeout=timeout
+        ) as response:
             response.raise_for_status()
 
             result = await response.json()
-            _LOGGER.debug(f"Request to {url}, Body: {data}, Result: {result}")
+            _LOGGER.debug(f"Request to {url}, Result: {result}")
 
         return result
 
-    def get_device_data(self, device_id: int) -> dict | None:
-        device_data = copy(self._devices.get(device_id))
+    def _get_timeout(self, endpoint: str) -> ClientTimeout:
+        timeout = self._endpoint_timeouts.get(endpoint, self._default_timeout)
+
+        return timeout
+
+    def get_device_data(self, device_id: int) -> Mapping | None:
+        """Latest snapshot of the device, read-only and never changed in place."""
+        device_data = self._devices.get(device_id)
 
         return device_data
 
-    async def set_value(self, device_id: int, key: str, value: int):
-        operation_description = (
-            f"update parameter {key} to {value}, Device: {device_id}"
+    def get_device_dict(self, device_id: int) -> dict | None:
+        """Plain copy of the device snapshot, e.g. for serialization."""
+        device_data = self._devices.get(device_id)
+
+        result = None
+
+        if device_data is not None:
+            result = {
+                key: dict(value) if isinstance(value, Mapping) else value
+                for key, value in device_data.items()
+            }
+
+        return result
+
+    def _publish_device(self, device_id: int, **changes):
+        """Replace snapshot of the device with a new version holding the changes."""
+        device_data = self._devices.get(device_id)
+
+        snapshot = (
+            {"metadata": None, "data": None, "stale": False, "version": 0}
+            if device_data is None
+            else dict(device_data)
         )
 
+        for key in changes:
+            value = changes[key]
+
+            snapshot[key] = (
+                MappingProxyType(value) if isinstance(value, dict) else value
+            )
+
+        snapshot["version"] += 1
+
+        self._devices[device_id] = MappingProxyType(snapshot)
+
+    async def set_value(self, device_id: int, key: str, value: int) -> bool:
+        success = await self.enqueue_telemetry(device_id, key, value)
+
+        return success
+
+    async def set_direct_request(
+        self, device_id: int, action_name: str, payload: dict
+    ) -> bool:
+        success = await self.enqueue_direct_request(device_id, action_name, payload)
+
+        return success
+
+    def enqueue_telemetry(self, device_id: int, key: str, value: int) -> Future:
+        """Queue telemetry update (low priority), future resolves with success."""
         if key in UPDATE_TELEMETRY_PARAMS:
-            key_parts = key.split("-")
+            future = self._enqueue_command(
+                device_id, key, COMMAND_PRIORITY_LOW, {"key": key, "value": int(value)}
+            )
 
-            request_data = {
-                "_deviceId": device_id,
-                "data": {},
-            }
+        else:
+            _LOGGER.warning(
+                f"Unsupported operation to update parameter {key} to {value}, "
+                f"Device: {device_id}"
+            )
 
-            data_item = request_data["data"]
+            future = get_running_loop().create_future()
+            future.set_result(False)
 
-            for key_part in key_parts:
-                data_item[key_part] = (
-                    int(value) if key_part == key_parts[len(key_parts) - 1] else {}
-                )
+        return future
+
+    def enqueue_direct_request(
+        self, device_id: int, action_name: str, payload: dict
+    ) -> Future:
+        """Queue direct method (high priority), future resolves with success."""
+        future = self._enqueue_command(
+            device_id,
+            action_name,
+            COMMAND_PRIORITY_HIGH,
+            {"action_name": action_name, "payload": payload},
+        )
+
+        return future
 
-                data_item = data_item[key_part]
+    def _enqueue_command(
+        self, device_id: int, command_key: str, priority: int, params: dict
+    ) -> Future:
+        """Queue command, replacing queued command of the same key."""
+        future = get_running_loop().create_future()
+        command_queue = self._command_queues.setdefault(device_id, {})
 
-            response = await self._post_request(Endpoints.UpdateTelemetry, request_data)
-            success = response.get("success", False)
+        command = {
+            "priority": priority,
+            "params": params,
+            "futures": [future],
+            "queued_at": monotonic(),
+        }
+
+        replaced_command = command_queue.pop(command_key, None)
+
+        if replaced_command is not None:
+            command["futures"] = replaced_command.get("futures") + command["futures"]
+            command["queued_at"] = replaced_command.get("queued_at")
 
-            request_response = (
-                f"Request: {json.dumps(request_data)}, Response: {json.dumps(response)}"
+            self._command_metrics["replaced"] += 1
+
+        command_queue[command_key] = command
+
+        queue_depth = sum(len(queue) for queue in self._command_queues.values())
+        self._command_metrics["max_queue_depth"] = max(
+            self._command_metrics["max_queue_depth"], queue_depth
+        )
+
+        if device_id not in self._command_workers:
+            self._command_workers[device_id] = self._create_task(
+                self._process_commands(device_id)
             )
 
-            if success:
-                _LOGGER.info(
-                    f"Successfully {operation_description}, {request_response}"
+        return future
+
+    async def _process_commands(self, device_id: int):
+        """Execute high priority commands first, low priority ones in a batch."""
+        command_queue = self._command_queues[device_id]
+
+        try:
+            while len(command_queue) > 0:
+                high_priority_keys = [
+                    command_key
+                    for command_key in command_queue
+                    if command_queue[command_key]["priority"] == COMMAND_PRIORITY_HIGH
+                ]
+
+                if len(high_priority_keys) > 0:
+                    command = command_queue.pop(high_priority_keys[0])
+
+                    await self._execute_commands(device_id, [command])
+
+                else:
+                    # Batch window, telemetry updates queued meanwhile are sent together
+                    await sleep(TELEMETRY_BATCH_WINDOW.total_seconds())
+
+                    has_high_priority = any(
+                        command_queue[command_key]["priority"] == COMMAND_PRIORITY_HIGH
+                        for command_key in command_queue
+                    )
+
+                    if not has_high_priority:
+                        commands = [
+                            command_queue.pop(command_key)
+                            for command_key in list(command_queue.keys())
+                        ]
+
+                        await self._execute_commands(device_id, commands)
+
+        finally:
+            self._command_workers.pop(device_id, None)
+
+            if len(command_queue) == 0:
+                self._command_queues.pop(device_id, None)
+
+    async def _execute_commands(self, device_id: int, commands: list[dict]):
+        started_at = monotonic()
+        futures = []
+
+        for command in commands:
+            futures.extend(command.get("futures"))
+
+            self._command_wait_times.append(
+                round(started_at - command.get("queued_at"), 3)
+            )
+
+        try:
+            first_command = commands[0]
+
+            if first_command.get("priority") == COMMAND_PRIORITY_HIGH:
+                params = first_command.get("params")
+
+                success = await self._send_direct_request(
+                    device_id, params.get("action_name"), params.get("payload")
                 )
+
             else:
-                _LOGGER.error(f"Failed to {operation_description}, {request_response}")
+                values = {}
+
+                for command in commands:
+                    params = command.get("params")
+                    values[params.get("key")] = params.get("value")
+
+                success = await self._send_telemetry(device_id, values)
+
+            self._command_metrics["executed"] += len(commands)
+
+            for future in futures:
+                if not future.done():
+                    future.set_result(success)
+
+        except Exception as ex:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(ex)
+
+        finally:
+            # Cancelled while sending, e.g. on terminate
+            for future in futures:
+                if not future.done():
+                    future.cancel()
+
+    def _cancel_queued_commands(self):
+        """Commands not sent are cancelled, so their values are rolled back."""
+        for device_id in list(self._command_queues.keys()):
+            command_queue = self._command_queues.pop(device_id)
+
+            if len(command_queue) > 0:
+                _LOGGER.warning(
+                    f"Queued commands were not sent, "
+                    f"Device: {device_id}, "
+                    f"Commands: {list(command_queue.keys())}"
+                )
+
+            for command_key in command_queue:
+                for future in command_queue[command_key].get("futures"):
+                    if not future.done():
+                        future.cancel()
+
+    @property
+    def command_metrics(self) -> dict:
+        wait_times = self._command_wait_times
+        average_wait_time = None
+
+        if len(wait_times) > 0:
+            average_wait_time = round(sum(wait_times) / len(wait_times), 3)
+
+        result = {
+            **self._command_metrics,
+            "queue_depth": sum(len(queue) for queue in self._command_queues.values()),
+            "average_wait_time": average_wait_time,
+            "max_wait_time": None if len(wait_times) == 0 else max(wait_times),
+        }
 
+        return result
+
+    async def _send_telemetry(self, device_id: int, values: dict[str, int]) -> bool:
+        operation_description = f"update parameters {values}, Device: {device_id}"
+
+        request_data = {
+            "_deviceId": device_id,
+            "data": self._get_telemetry_data(values),
+        }
+
+        response = await self._execute_authenticated_request(
+            lambda: self._post_request(Endpoints.UpdateTelemetry, request_data),
+            operation_description,
+        )
+        success = response.get("success", False)
+
+        request_response = (
+            f"Request: {json.dumps(request_data)}, Response: {json.dumps(response)}"
+        )
+
+        if success:
+            _LOGGER.info(f"Successfully {operation_description}, {request_response}")
         else:
-            _LOGGER.warning(f"Unsupported operation to {operation_description}")
+            _LOGGER.error(f"Failed to {operation_description}, {request_response}")
+
+        return success
+
+    @staticmethod
+    def _get_telemetry_data(values: dict[str, int]) -> dict:
+        """Merge hyphenated keys into a nested dictionary."""
+        data = {}
+
+        for key in values:
+            key_parts = key.split("-")
+            data_item = data
 
-    async def set_direct_request(self, device_id: int, action_name: str, payload: dict):
+            for key_part in key_parts[:-1]:
+                data_item = data_item.setdefault(key_part, {})
+
+            data_item[key_parts[-1]] = values[key]
+
+        return data
+
+    async def _send_direct_request(
+        self, device_id: int, action_name: str, payload: dict
+    ) -> bool:
         operation_description = (
             f"update parameter {action_name} to {payload}, Device: {device_id}"
         )
@@ -378,7 +1278,10 @@ class RestAPI:
             "data": payload,
         }
 
-        response = await self._post_request(Endpoints.DirectMethod, request_data)
+        response = await self._execute_authenticated_request(
+            lambda: self._post_request(Endpoints.DirectMethod, request_data),
+            operation_description,
+        )
         success = response.get("success", False)
 
         if success:
@@ -387,3 +1290,5 @@ class RestAPI:
             _LOGGER.error(
                 f"Failed to {operation_description}, Data: {json.dumps(response)}"
             )
+
+        return success
@@ -0,0 +1,105 @@
+from asyncio import sleep
+import logging
+from random import uniform
+from typing import Any, Awaitable, Callable
+
+from aiohttp import ClientConnectionError, ClientResponseError
+
+from ..common.consts import (
+    API_MAX_ATTEMPTS,
+    API_RETRY_BASE_DELAY,
+    API_RETRY_BUDGET,
+    API_RETRY_MAX_DELAY,
+    API_RETRYABLE_STATUSES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RetryPolicy:
+    """Retry single requests using exponential backoff with full jitter."""
+
+    _max_attempts: int
+    _base_delay: float
+    _max_delay: float
+    _budget: int
+    _retryable_statuses: list[int]
+    _remaining_budget: int
+
+    def __init__(
+        self,
+        max_attempts: int = API_MAX_ATTEMPTS,
+        base_delay: float = API_RETRY_BASE_DELAY,
+        max_delay: float = API_RETRY_MAX_DELAY,
+        budget: int = API_RETRY_BUDGET,
+        retryable_statuses: list[int] | None = None,
+    ):
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._budget = budget
+        self._retryable_statuses = (
+            API_RETRYABLE_STATUSES if retryable_statuses is None else retryable_statuses
+        )
+
+        self._remaining_budget = budget
+
+    @property
+    def remaining_budget(self) -> int:
+        result = self._remaining_budget
+
+        return result
+
+    def reset_budget(self):
+        self._remaining_budget = self._budget
+
+    def is_retryable(self, ex: Exception) -> bool:
+        if isinstance(ex, ClientResponseError):
+            result = ex.status in self._retryable_statuses
+
+        else:
+            result = isinstance(ex, (ClientConnectionError, TimeoutError))
+
+        return result
+
+    def get_delay(self, attempt: int) -> float:
+        max_delay = min(self._max_delay, self._base_delay * (2 ** (attempt - 1)))
+        result = uniform(0, max_delay)
+
+        return result
+
+    async def execute(
+        self, action: Callable[[], Awaitable[Any]], description: str
+    ) -> Any:
+        attempt = 1
+
+        while True:
+            try:
+                result = await action()
+
+                return result
+
+            except Exception as ex:
+                can_retry = (
+                    attempt < self._max_attempts
+                    and self._remaining_budget > 0
+                    and self.is_retryable(ex)
+                )
+
+                if not can_retry:
+                    raise ex
+
+                self._remaining_budget -= 1
+
+                delay = self.get_delay(attempt)
+
+                _LOGGER.debug(
+                    f"Failed to {description} (Attempt #{attempt}), "
+                    f"retrying in {delay:.2f}s, "
+                    f"Remaining budget: {self._remaining_budget}, "
+                    f"Error: {ex}"
+                )
+
+                await sleep(delay)
+
+                attempt += 1
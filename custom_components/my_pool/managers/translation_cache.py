@@ -0,0 +1,91 @@
+from asyncio import Lock
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import translation
+from homeassistant.util import slugify
+
+from ..common.consts import DATA_TRANSLATION_CACHE, DOMAIN
+from ..common.entity_descriptions import (
+    DEFAULT_ENTITY_DESCRIPTIONS,
+    IntegrationEntityDescription,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TranslationCache:
+    """Entity names translated once per language, shared by all config entries."""
+
+    _hass: HomeAssistant
+    _language: str | None
+    _entity_names: dict[tuple[str, str], str | None]
+    _lock: Lock
+
+    def __init__(self, hass: HomeAssistant):
+        self._hass = hass
+
+        self._language = None
+        self._entity_names = {}
+        self._lock = Lock()
+
+    @staticmethod
+    async def async_get(hass: HomeAssistant) -> "TranslationCache":
+        """Get the shared cache, loaded for the current language of HA."""
+        cache = hass.data.get(DATA_TRANSLATION_CACHE)
+
+        if cache is None:
+            cache = TranslationCache(hass)
+
+            hass.data[DATA_TRANSLATION_CACHE] = cache
+
+        await cache.load()
+
+        return cache
+
+    async def load(self):
+        """Load translations, only when the language of HA has changed."""
+        async with self._lock:
+            language = self._hass.config.language
+
+            if language == self._language:
+                return
+
+            translations = await translation.async_get_translations(
+                self._hass, language, "entity", {DOMAIN}
+            )
+
+            self._entity_names = {
+                (entity_description.platform, entity_description.key): translations.get(
+                    self._get_translation_key(entity_description),
+                    entity_description.name,
+                )
+                for entity_description in DEFAULT_ENTITY_DESCRIPTIONS
+            }
+
+            self._language = language
+
+            _LOGGER.debug(
+                f"Translations loaded, "
+                f"Language: {language}, "
+                f"Entities: {len(self._entity_names)}"
+            )
+
+    def get_entity_name(
+        self, entity_description: IntegrationEntityDescription
+    ) -> str | None:
+        result = self._entity_names.get(
+            (entity_description.platform, entity_description.key),
+            entity_description.name,
+        )
+
+        return result
+
+    @staticmethod
+    def _get_translation_key(entity_description: IntegrationEntityDescription) -> str:
+        entity_key = slugify(entity_description.key)
+        platform = entity_description.platform
+
+        result = f"component.{DOMAIN}.entity.{platform}.{entity_key}.name"
+
+        return result
@@ -47,9 +47,9 @@ class Test:
         await self._api.update()
 
         for device_id in self._api.devices:
-            device_id = self._api.get_device_data(device_id)
+            device_data = self._api.get_device_dict(device_id)
 
-            _LOGGER.info(f"{device_id}: {json.dumps(device_id, indent=4)}")
+            _LOGGER.info(f"{device_id}: {json.dumps(device_data, indent=4)}")
 
         await self._api.terminate()
 
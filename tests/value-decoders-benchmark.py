@@ -0,0 +1,101 @@
+import timeit
+
+from custom_components.my_pool.common.consts import UNIT_PH
+from custom_components.my_pool.common.entity_descriptions import (
+    DEFAULT_ENTITY_DESCRIPTIONS,
+)
+from custom_components.my_pool.common.value_decoders import get_value_decoder
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.const import Platform
+
+ITERATIONS = 10000
+
+DEVICE_DATA = {
+    "runtime-ph-value": 72,
+    "config-user-ph": 72,
+    "runtime-cpuTemperature-value": 4512,
+    "runtime-boardTemperature-value": 3875,
+    "runtime-waterTemperature-value": 956,
+    "runtime-cell-temperature-value": 2650,
+    "network-rcpi": 120,
+}
+
+ENTITY_DESCRIPTIONS = [
+    entity_description
+    for entity_description in DEFAULT_ENTITY_DESCRIPTIONS
+    if entity_description.platform in [Platform.SENSOR, Platform.NUMBER]
+    and entity_description.key in DEVICE_DATA
+]
+
+VALUE_DECODERS = {
+    entity_description.key: get_value_decoder(entity_description)
+    for entity_description in ENTITY_DESCRIPTIONS
+}
+
+
+def decode_by_description(entity_description, state):
+    """Decoding as done before, branching by description on every call."""
+    unit_of_measurement = entity_description.native_unit_of_measurement
+
+    if entity_description.platform == Platform.NUMBER:
+        if unit_of_measurement == UNIT_PH:
+            state_str = str(state)
+            state_str_fixed = f"{state_str[:1]}.{state_str[1:].ljust(2, '0')}"
+            state = float(state_str_fixed)
+
+    elif entity_description.device_class == SensorDeviceClass.TEMPERATURE:
+        state_str = str(state)
+        state_str_fixed = f"{state_str[:2]}.{state_str[2:].ljust(2, '0')}"
+        state = float(state_str_fixed)
+
+    elif entity_description.device_class == SensorDeviceClass.SIGNAL_STRENGTH:
+        state = (state / 2) - 110
+
+    elif unit_of_measurement == UNIT_PH:
+        state_str = str(state)
+        state_str_fixed = f"{state_str[:1]}.{state_str[1:].ljust(2, '0')}"
+        state = float(state_str_fixed)
+
+    return state
+
+
+def decode_by_table(entity_description, state):
+    value_decoder = VALUE_DECODERS.get(entity_description.key)
+
+    if value_decoder is not None:
+        state = value_decoder(state)
+
+    return state
+
+
+def decode_all(decoder):
+    for entity_description in ENTITY_DESCRIPTIONS:
+        decoder(entity_description, DEVICE_DATA[entity_description.key])
+
+
+def test_decoded_values():
+    print("Decoded values (before / after)")
+
+    for entity_description in ENTITY_DESCRIPTIONS:
+        state = DEVICE_DATA[entity_description.key]
+
+        before = decode_by_description(entity_description, state)
+        after = decode_by_table(entity_description, state)
+
+        print(f"{entity_description.key}: {state} -> {before} / {after}")
+
+
+def test_decode_performance():
+    print(f"Decode cost per update ({len(ENTITY_DESCRIPTIONS)} entities)")
+
+    for name, decoder in [
+        ("Per description", decode_by_description),
+        ("Precompiled", decode_by_table),
+    ]:
+        duration = timeit.timeit(lambda: decode_all(decoder), number=ITERATIONS)
+
+        print(f"{name}: {duration / ITERATIONS * 1000000:.2f}us")
+
+
+test_decoded_values()
+test_decode_performance()